@@ -14,8 +14,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Main Entry Point for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.1-1-1.4-2
-LAST MODIFIED: 2026-02-12
+FILE VERSION: v5.1-1-1.4-3
+LAST MODIFIED: 2026-10-18
 PHASE: Phase 1 - Unified Vigil Evaluation
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
@@ -76,8 +76,14 @@ from typing import List, Optional
 
 import uvicorn
 
+# Optional libuv-based event loop (installed with uvicorn[standard] on Linux)
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - depends on platform
+    uvloop = None
+
 # Module version
-__version__ = "v5.1-1-1.4-2"
+__version__ = "v5.1-1-1.4-3"
 
 # =============================================================================
 # Manager Imports
@@ -120,7 +126,7 @@ from src.evaluators import (
     EvaluationReportGenerator,
 )
 
-from src.api.app import create_app, app_state
+from src.api.app import create_app, app_state, InjectedManagers
 
 
 # =============================================================================
@@ -306,12 +312,15 @@ class AshThrash:
         try:
             # Create FastAPI app with injected managers
             app = create_app(
-                config_manager=self.config,
-                logging_manager=self.logging_mgr,
-                nlp_client=self.nlp_client,
-                phrase_loader=self.phrase_loader,
-                test_runner=self.test_runner,
-                snapshot_manager=self.snapshot_manager,
+                InjectedManagers(
+                    config_manager=self.config,
+                    logging_manager=self.logging_mgr,
+                    nlp_client=self.nlp_client,
+                    phrase_loader=self.phrase_loader,
+                    test_runner=self.test_runner,
+                    snapshot_manager=self.snapshot_manager,
+                    result_analyzer=self.result_analyzer,
+                )
             )
 
             self._logger.info(f"Starting API server on {host}:{port}")
@@ -1015,10 +1024,15 @@ def main() -> int:
     args = parse_args()
     app = AshThrash()
 
+    # Prefer uvloop for the event loop when available. The server is started
+    # via uvicorn.Server.serve() inside our own loop, so uvicorn's own
+    # loop="auto" selection never applies - it must be chosen here.
+    run = uvloop.run if uvloop is not None else asyncio.run
+
     try:
         if args.run_vigil_eval:
             # Run Ash-Vigil model evaluation
-            return asyncio.run(
+            return run(
                 app.run_vigil_eval(
                     categories=args.categories,
                     verbose=args.verbose,
@@ -1029,7 +1043,7 @@ def main() -> int:
             )
         elif args.run_tests:
             # Run tests and exit
-            return asyncio.run(
+            return run(
                 app.run_tests(
                     categories=args.categories,
                     verbose=args.verbose,
@@ -1043,7 +1057,7 @@ def main() -> int:
             )
         else:
             # Run API server
-            return asyncio.run(
+            return run(
                 app.run_server(
                     host=args.host,
                     port=args.port,
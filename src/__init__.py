@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Ash-Thrash Source Package
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-2-2.1-1
-LAST MODIFIED: 2026-01-26
-PHASE: Phase 2 - Ash-Thrash Evaluation Infrastructure
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -26,6 +26,7 @@ PACKAGES:
 - managers:   Configuration and resource management
 - evaluators: Ash-Vigil model evaluation framework (Phase 2)
 - validators: Response and classification validation
+- utils:      Shared helpers (JSON I/O)
 - config:     JSON configuration files
 - templates:  Jinja2 report templates
 
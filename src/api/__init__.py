@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Ash-Thrash API Package
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-2-2.4-1
-LAST MODIFIED: 2026-01-20
-PHASE: Phase 2 - Test Execution Engine
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -40,7 +40,7 @@ __author__ = "The Alphabet Cartel"
 __email__ = "dev@alphabetcartel.org"
 __url__ = "https://github.com/the-alphabet-cartel/ash-thrash"
 
-from src.api.app import create_app, get_app
+from src.api.app import create_app, get_app, InjectedManagers
 
 __all__ = [
     "__version__",
@@ -49,4 +49,5 @@ __all__ = [
     "__url__",
     "create_app",
     "get_app",
+    "InjectedManagers",
 ]
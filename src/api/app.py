@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 FastAPI Application for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-6-6.3-4
-LAST MODIFIED: 2026-02-07
-PHASE: Phase 6 - A/B Testing Infrastructure (v5.1 Migration Phase 1)
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -31,7 +31,8 @@ ENDPOINTS:
     GET  /status  - Detailed service status
     GET  /        - Service information
     GET  /snapshots           - List available test run snapshots
-    POST /snapshots/capture   - Capture snapshot from last test run
+    POST /snapshots/capture   - Capture snapshot from last test run (async)
+    GET  /snapshots/{job_id}/status - Poll a snapshot capture job
     POST /comparisons/compare - Compare two snapshots (A/B analysis)
     GET  /comparisons/thresholds - Get current comparison thresholds
 
@@ -45,17 +46,27 @@ USAGE:
     uvicorn.run(app, host="0.0.0.0", port=30888)
 """
 
+import asyncio
+import contextlib
+import hashlib
 import logging
 import os
+import time
+import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi import BackgroundTasks, FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from src.utils.json_utils import dumps_json
+from src.utils.time_utils import CachedTimeFormatter
 
 # Module version
-__version__ = "v5.0-6-6.3-4"
+__version__ = "v5.0-6-6.5-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -68,8 +79,111 @@ SERVICE_NAME = "ash-thrash"
 SERVICE_DESCRIPTION = "Discord Crisis Detection Testing Suite"
 SERVICE_VERSION = "5.0.0"
 
-# Start time (for uptime calculation)
-_start_time: Optional[datetime] = None
+# Static service information returned by GET /
+SERVICE_INFO: Dict[str, Any] = {
+    "service": SERVICE_NAME,
+    "description": SERVICE_DESCRIPTION,
+    "version": SERVICE_VERSION,
+    "community": "The Alphabet Cartel",
+    "links": {
+        "discord": "https://discord.gg/alphabetcartel",
+        "website": "https://alphabetcartel.org",
+        "repository": "https://github.com/the-alphabet-cartel/ash-thrash",
+    },
+    "endpoints": {
+        "health": "/health",
+        "status": "/status",
+        "snapshots": "/snapshots",
+        "capture_snapshot": "/snapshots/capture",
+        "capture_status": "/snapshots/{job_id}/status",
+        "compare": "/comparisons/compare",
+        "thresholds": "/comparisons/thresholds",
+        "docs": "/docs",
+    },
+}
+_ROOT_PAYLOAD: bytes = dumps_json(SERVICE_INFO)
+
+# AppState managers reported (present / missing) under /status "components"
+STATUS_COMPONENTS = (
+    "config_manager",
+    "logging_manager",
+    "nlp_client",
+    "phrase_loader",
+    "test_runner",
+    "snapshot_manager",
+    "comparison_analyzer",
+    "result_analyzer",
+)
+
+# Start time - monotonic clock for uptime, ISO string for display
+# (module import until lifespan startup resets it, e.g. when served
+# without lifespan events)
+_start_time: float = time.monotonic()
+_start_datetime_iso: Optional[str] = None
+
+# Second-resolution ISO 8601 local timestamps for status responses
+_iso_time = CachedTimeFormatter("%Y-%m-%dT%H:%M:%S")
+
+# /status cache - (monotonic build time, serialized body, ETag). The body
+# holds everything except timestamp/uptime, which are spliced in per
+# request so the payload is only JSON-encoded once per rebuild. While the app is running
+# a background task rebuilds it every _STATUS_TTL seconds so requests only
+# read memory; without it, requests rebuild it once it is _STATUS_TTL old
+_STATUS_TTL = 1.0
+_status_cache: Optional[Tuple[float, bytes, str]] = None
+_status_lock = asyncio.Lock()
+_status_refresh_task: Optional[asyncio.Task] = None
+
+# Serializes manager initialization so concurrent lifespans can't both
+# see is_ready == False and build duplicate clients
+_init_lock = asyncio.Lock()
+
+# Pre-serialized healthy /health body - {"status":"ok","timestamp":"..."}
+_HEALTH_OK_PREFIX = b'{"status":"ok","timestamp":"'
+_HEALTH_OK_SUFFIX = b'"}'
+_health_ok_body: Tuple[str, bytes] = ("", b"")
+
+# Snapshot capture jobs by job_id, oldest first; only the most recent
+# MAX_CAPTURE_JOBS are kept for status polling
+MAX_CAPTURE_JOBS = 100
+_capture_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Encoded /snapshots bodies by (sort_by, reverse) -> ((manager, listing
+# signature), body, ETag)
+MAX_SNAPSHOT_LIST_BODIES = 16
+_snapshot_list_bodies: Dict[
+    Tuple[str, bool], Tuple[Tuple[Any, Tuple[int, int]], bytes, str]
+] = {}
+
+# Encoded /comparisons/thresholds body and ETag, with the analyzer they
+# were built from
+_thresholds_body: Tuple[Optional[Any], bytes, str] = (None, b"", "")
+
+# Cache-Control for slowly changing listings that pollers may reuse briefly
+LISTING_CACHE_CONTROL = "max-age=5"
+
+# Comparison results keyed on (baseline path, mtime, candidate path, mtime);
+# compare() is pure for a given pair of snapshot files apart from its
+# compared_at stamp, which is refreshed on every hit. LRU order
+COMPARISON_CACHE_SIZE = 32
+_comparison_cache: "OrderedDict[Tuple[str, int, str, int], Dict[str, Any]]" = OrderedDict()
+
+
+# =============================================================================
+# Response Class
+# =============================================================================
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered through dumps_json (orjson when installed).
+    
+    Used as the app's default_response_class so dicts returned by the
+    endpoints skip the stdlib json encoder. FastAPI's own ORJSONResponse
+    is deprecated in newer releases, hence the local subclass.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
 
 
 # =============================================================================
@@ -81,8 +195,23 @@ class AppState:
     Application state container.
     
     Holds references to managers and configuration for use in endpoints.
+    Uses __slots__ since endpoints read these attributes on every request.
     """
     
+    __slots__ = (
+        "config_manager",
+        "logging_manager",
+        "nlp_client",
+        "phrase_loader",
+        "test_runner",
+        "snapshot_manager",
+        "comparison_analyzer",
+        "result_analyzer",
+        "is_ready",
+        "initialization_error",
+        "_components_snapshot",
+    )
+    
     def __init__(self):
         self.config_manager = None
         self.logging_manager = None
@@ -91,13 +220,55 @@ class AppState:
         self.test_runner = None
         self.snapshot_manager = None
         self.comparison_analyzer = None
+        self.result_analyzer = None
         self.is_ready = False
         self.initialization_error: Optional[str] = None
+        
+        # /status components map, frozen once the service is ready
+        self._components_snapshot: Optional[Dict[str, bool]] = None
 
 
 # Global state
 app_state = AppState()
 
+# (app_state attribute, factory, builds factory kwargs from app_state)
+ManagerSpec = Tuple[str, Callable[..., Any], Callable[[AppState], Dict[str, Any]]]
+
+
+@dataclass
+class InjectedManagers:
+    """
+    Bundle of pre-built managers to inject into the application.
+    
+    Any field left as None is created during startup by
+    _initialize_managers().
+    """
+    config_manager: Optional[Any] = None
+    logging_manager: Optional[Any] = None
+    nlp_client: Optional[Any] = None
+    phrase_loader: Optional[Any] = None
+    test_runner: Optional[Any] = None
+    snapshot_manager: Optional[Any] = None
+    comparison_analyzer: Optional[Any] = None
+    result_analyzer: Optional[Any] = None
+    
+    def provided(self) -> Dict[str, Any]:
+        """Return the managers that were actually supplied, by field name."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+        }
+    
+    def is_complete(self) -> bool:
+        """Check whether all managers critical for serving are supplied."""
+        return (
+            self.config_manager is not None
+            and self.nlp_client is not None
+            and self.phrase_loader is not None
+            and self.test_runner is not None
+        )
+
 
 # =============================================================================
 # Lifespan Management
@@ -110,33 +281,44 @@ async def lifespan(app: FastAPI):
     
     Handles startup and shutdown events for the FastAPI application.
     """
-    global _start_time
+    global _start_time, _start_datetime_iso, _status_refresh_task
     
     # Startup
-    _start_time = datetime.now()
-    logger.info(f"🚀 {SERVICE_NAME} v{SERVICE_VERSION} starting up...")
+    _start_time = time.monotonic()
+    _start_datetime_iso = datetime.now().isoformat()
+    logger.info("🚀 %s v%s starting up...", SERVICE_NAME, SERVICE_VERSION)
     
     # Initialize managers if not already done
-    if not app_state.is_ready and not app_state.initialization_error:
-        try:
-            await _initialize_managers()
-            app_state.is_ready = True
-            logger.info(f"✅ {SERVICE_NAME} is ready")
-        except Exception as e:
-            app_state.initialization_error = str(e)
-            logger.error(f"❌ Initialization failed: {e}")
+    async with _init_lock:
+        if not app_state.is_ready and not app_state.initialization_error:
+            try:
+                await _initialize_managers()
+                app_state.is_ready = True
+                logger.info("✅ %s is ready", SERVICE_NAME)
+            except Exception as e:
+                app_state.initialization_error = str(e)
+                logger.error("❌ Initialization failed: %s", e)
+    
+    # Keep /status off the request path
+    _status_refresh_task = asyncio.create_task(_refresh_status_loop())
     
     yield
     
     # Shutdown
-    logger.info(f"🛑 {SERVICE_NAME} shutting down...")
+    logger.info("🛑 %s shutting down...", SERVICE_NAME)
     
     # Cleanup
+    if _status_refresh_task:
+        _status_refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _status_refresh_task
+        _status_refresh_task = None
+    
     if app_state.nlp_client:
         try:
             await app_state.nlp_client.close()
         except Exception as e:
-            logger.warning(f"Error closing NLP client: {e}")
+            logger.warning("Error closing NLP client: %s", e)
 
 
 async def _initialize_managers():
@@ -144,6 +326,17 @@ async def _initialize_managers():
     Initialize all managers for the application.
     
     This is called during startup if managers haven't been injected.
+    
+    Managers are declared as stages of (attribute, factory, kwargs builder)
+    entries. Each stage only depends on managers from earlier stages, so
+    any missing managers within a stage are built concurrently in worker
+    threads (their factories do blocking file I/O):
+    
+        1. Config
+        2. Logging
+        3. NLP client, phrase loader, snapshot manager, comparison and
+           result analyzers
+        4. Test runner (needs the NLP client and phrases)
     """
     # Lazy imports to avoid circular dependencies
     from src.managers import (
@@ -154,70 +347,66 @@ async def _initialize_managers():
         create_test_runner_manager,
         create_snapshot_manager,
         create_comparison_analyzer_manager,
-    )
-    from src.validators import (
-        create_classification_validator,
-        create_response_validator,
+        create_result_analyzer_manager,
     )
     
     logger.info("📦 Initializing managers...")
     
-    # Config
-    if not app_state.config_manager:
-        app_state.config_manager = create_config_manager()
-    
-    # Logging
-    if not app_state.logging_manager:
-        app_state.logging_manager = create_logging_config_manager(
-            config_manager=app_state.config_manager
-        )
+    def common_kwargs(state: AppState) -> Dict[str, Any]:
+        return {
+            "config_manager": state.config_manager,
+            "logging_manager": state.logging_manager,
+        }
     
-    # NLP Client
-    if not app_state.nlp_client:
-        app_state.nlp_client = create_nlp_client_manager(
-            config_manager=app_state.config_manager,
-            logging_manager=app_state.logging_manager,
+    def test_runner_kwargs(state: AppState) -> Dict[str, Any]:
+        # Validators are only used by the test runner, so they (and their
+        # import) are skipped entirely when a test runner was injected
+        from src.validators import (
+            create_classification_validator,
+            create_response_validator,
         )
+        
+        return {
+            "nlp_client": state.nlp_client,
+            "phrase_loader": state.phrase_loader,
+            "classification_validator": create_classification_validator(
+                logging_manager=state.logging_manager
+            ),
+            "response_validator": create_response_validator(
+                logging_manager=state.logging_manager
+            ),
+            **common_kwargs(state),
+        }
     
-    # Phrase Loader
-    if not app_state.phrase_loader:
-        app_state.phrase_loader = create_phrase_loader_manager(
-            config_manager=app_state.config_manager,
-            logging_manager=app_state.logging_manager,
-        )
+    stages: List[List[ManagerSpec]] = [
+        [("config_manager", create_config_manager, lambda state: {})],
+        [(
+            "logging_manager",
+            create_logging_config_manager,
+            lambda state: {"config_manager": state.config_manager},
+        )],
+        [
+            ("nlp_client", create_nlp_client_manager, common_kwargs),
+            ("phrase_loader", create_phrase_loader_manager, common_kwargs),
+            ("snapshot_manager", create_snapshot_manager, common_kwargs),
+            ("comparison_analyzer", create_comparison_analyzer_manager, common_kwargs),
+            ("result_analyzer", create_result_analyzer_manager, common_kwargs),
+        ],
+        [("test_runner", create_test_runner_manager, test_runner_kwargs)],
+    ]
     
-    # Validators
-    class_validator = create_classification_validator(
-        logging_manager=app_state.logging_manager
-    )
-    resp_validator = create_response_validator(
-        logging_manager=app_state.logging_manager
-    )
-    
-    # Test Runner
-    if not app_state.test_runner:
-        app_state.test_runner = create_test_runner_manager(
-            nlp_client=app_state.nlp_client,
-            phrase_loader=app_state.phrase_loader,
-            classification_validator=class_validator,
-            response_validator=resp_validator,
-            config_manager=app_state.config_manager,
-            logging_manager=app_state.logging_manager,
-        )
-
-    # Snapshot Manager (Phase 6)
-    if not app_state.snapshot_manager:
-        app_state.snapshot_manager = create_snapshot_manager(
-            config_manager=app_state.config_manager,
-            logging_manager=app_state.logging_manager,
-        )
-
-    # Comparison Analyzer (Phase 6)
-    if not app_state.comparison_analyzer:
-        app_state.comparison_analyzer = create_comparison_analyzer_manager(
-            config_manager=app_state.config_manager,
-            logging_manager=app_state.logging_manager,
-        )
+    for stage in stages:
+        pending = [spec for spec in stage if getattr(app_state, spec[0]) is None]
+        if not pending:
+            continue
+        
+        # Fan out, then assign on the event loop
+        managers = await asyncio.gather(*(
+            asyncio.to_thread(factory, **build_kwargs(app_state))
+            for _, factory, build_kwargs in pending
+        ))
+        for (name, _, _), manager in zip(pending, managers):
+            setattr(app_state, name, manager)
     
     logger.info("✅ All managers initialized")
 
@@ -227,13 +416,8 @@ async def _initialize_managers():
 # =============================================================================
 
 def create_app(
-    config_manager: Optional[Any] = None,
-    logging_manager: Optional[Any] = None,
-    nlp_client: Optional[Any] = None,
-    phrase_loader: Optional[Any] = None,
-    test_runner: Optional[Any] = None,
-    snapshot_manager: Optional[Any] = None,
-    comparison_analyzer: Optional[Any] = None,
+    managers: Optional[InjectedManagers] = None,
+    **manager_kwargs: Any,
 ) -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -242,44 +426,47 @@ def create_app(
     Optionally accepts pre-configured managers for dependency injection.
     
     Args:
-        config_manager: Optional ConfigManager instance
-        logging_manager: Optional LoggingConfigManager instance
-        nlp_client: Optional NLPClientManager instance
-        phrase_loader: Optional PhraseLoaderManager instance
-        test_runner: Optional TestRunnerManager instance
+        managers: Optional InjectedManagers bundle
+        **manager_kwargs: Individual managers by InjectedManagers field name
+            (config_manager=..., nlp_client=..., etc.); merged over the
+            bundle for backward compatibility
     
     Returns:
         Configured FastAPI application
     
+    Note:
+        The event loop is chosen by whoever runs the app, not here.
+        main.py runs under uvloop.run() when uvloop is installed, and a
+        standalone uvicorn (from uvicorn[standard]) picks uvloop and
+        httptools by default (--loop auto --http auto). For a multi-core
+        host run e.g. `uvicorn ... --loop uvloop --http httptools
+        --workers N`; note app_state and its caches are per worker.
+    
     Example:
         >>> app = create_app()
         >>> uvicorn.run(app, host="0.0.0.0", port=30888)
         
         >>> # With dependency injection
         >>> config = create_config_manager()
-        >>> app = create_app(config_manager=config)
+        >>> app = create_app(InjectedManagers(config_manager=config))
     """
     global _app
     
-    # Store injected managers
-    if config_manager:
-        app_state.config_manager = config_manager
-    if logging_manager:
-        app_state.logging_manager = logging_manager
-    if nlp_client:
-        app_state.nlp_client = nlp_client
-    if phrase_loader:
-        app_state.phrase_loader = phrase_loader
-    if test_runner:
-        app_state.test_runner = test_runner
-    if snapshot_manager:
-        app_state.snapshot_manager = snapshot_manager
-    if comparison_analyzer:
-        app_state.comparison_analyzer = comparison_analyzer
+    if manager_kwargs:
+        # Raises TypeError for unknown manager names, like a normal signature
+        managers = InjectedManagers(**{
+            **(managers.provided() if managers else {}),
+            **manager_kwargs,
+        })
     
-    # Mark as ready if all critical managers are provided
-    if all([config_manager, nlp_client, phrase_loader, test_runner]):
-        app_state.is_ready = True
+    # Store injected managers
+    if managers:
+        for name, manager in managers.provided().items():
+            setattr(app_state, name, manager)
+        
+        # Mark as ready if all critical managers are provided
+        if managers.is_complete():
+            app_state.is_ready = True
     
     # Create FastAPI app
     app = FastAPI(
@@ -289,6 +476,7 @@ def create_app(
         docs_url="/docs",
         redoc_url="/redoc",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     
     # Register routes
@@ -297,7 +485,7 @@ def create_app(
     # Store global reference
     _app = app
     
-    logger.debug(f"🏭 Created FastAPI application")
+    logger.debug("🏭 Created FastAPI application")
     
     return app
 
@@ -316,35 +504,16 @@ def _register_routes(app: FastAPI) -> None:
     """Register all API routes."""
     
     @app.get("/", tags=["Info"])
-    async def root() -> Dict[str, Any]:
+    async def root() -> Response:
         """
         Service information endpoint.
         
         Returns basic information about the Ash-Thrash service.
         """
-        return {
-            "service": SERVICE_NAME,
-            "description": SERVICE_DESCRIPTION,
-            "version": SERVICE_VERSION,
-            "community": "The Alphabet Cartel",
-            "links": {
-                "discord": "https://discord.gg/alphabetcartel",
-                "website": "https://alphabetcartel.org",
-                "repository": "https://github.com/the-alphabet-cartel/ash-thrash",
-            },
-            "endpoints": {
-                "health": "/health",
-                "status": "/status",
-                "snapshots": "/snapshots",
-                "capture_snapshot": "/snapshots/capture",
-                "compare": "/comparisons/compare",
-                "thresholds": "/comparisons/thresholds",
-                "docs": "/docs",
-            },
-        }
+        return Response(content=_ROOT_PAYLOAD, media_type="application/json")
     
     @app.get("/health", tags=["Health"])
-    async def health_check() -> JSONResponse:
+    async def health_check() -> Response:
         """
         Health check endpoint for Docker/Kubernetes.
         
@@ -355,18 +524,24 @@ def _register_routes(app: FastAPI) -> None:
         Response format:
             {"status": "ok|unhealthy", "timestamp": "ISO8601"}
         """
-        timestamp = datetime.now().isoformat()
+        global _health_ok_body
+        
+        timestamp = _iso_timestamp()
         
         if app_state.is_ready:
-            return JSONResponse(
+            # Healthy payload only changes with the (per-second) timestamp,
+            # so the encoded body is rebuilt at most once a second
+            cached_timestamp, body = _health_ok_body
+            if cached_timestamp != timestamp:
+                body = _HEALTH_OK_PREFIX + timestamp.encode() + _HEALTH_OK_SUFFIX
+                _health_ok_body = (timestamp, body)
+            return Response(
                 status_code=200,
-                content={
-                    "status": "ok",
-                    "timestamp": timestamp,
-                }
+                content=body,
+                media_type="application/json",
             )
         else:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=503,
                 content={
                     "status": "unhealthy",
@@ -376,79 +551,49 @@ def _register_routes(app: FastAPI) -> None:
             )
     
     @app.get("/status", tags=["Health"])
-    async def detailed_status() -> Dict[str, Any]:
+    async def detailed_status(request: Request) -> Response:
         """
         Detailed service status endpoint.
         
-        Returns comprehensive information about service state.
-        """
-        timestamp = datetime.now()
-        
-        # Calculate uptime
-        uptime_seconds = 0.0
-        if _start_time:
-            uptime_seconds = (timestamp - _start_time).total_seconds()
-        
-        # Base response
-        response: Dict[str, Any] = {
-            "service": SERVICE_NAME,
-            "version": SERVICE_VERSION,
-            "status": "ready" if app_state.is_ready else "initializing",
-            "timestamp": timestamp.isoformat(),
-            "uptime_seconds": uptime_seconds,
-        }
-        
-        # Add component status
-        components: Dict[str, Any] = {
-            "config_manager": app_state.config_manager is not None,
-            "logging_manager": app_state.logging_manager is not None,
-            "nlp_client": app_state.nlp_client is not None,
-            "phrase_loader": app_state.phrase_loader is not None,
-            "test_runner": app_state.test_runner is not None,
-            "snapshot_manager": app_state.snapshot_manager is not None,
-            "comparison_analyzer": app_state.comparison_analyzer is not None,
-        }
-        response["components"] = components
+        Returns comprehensive information about service state. Component
+        details come from the background-refreshed cache; timestamp and
+        uptime are always current.
         
-        # Add phrase statistics if available
-        if app_state.phrase_loader:
-            try:
-                stats = app_state.phrase_loader.get_statistics()
-                response["phrases"] = {
-                    "total": stats.total_phrases,
-                    "files_loaded": stats.files_loaded,
-                    "categories": list(stats.by_category.keys()),
-                }
-            except Exception as e:
-                response["phrases"] = {"error": str(e)}
+        The weak ETag covers everything except timestamp and uptime, so a
+        matching If-None-Match gets 304 Not Modified with no body.
+        """
+        global _status_cache
         
-        # Add NLP client status if available
-        if app_state.nlp_client:
-            try:
-                response["nlp_client"] = app_state.nlp_client.get_status_info()
-            except Exception as e:
-                response["nlp_client"] = {"error": str(e)}
+        cached = _status_cache
+        stale = cached is None or (
+            _status_refresh_task is None
+            and time.monotonic() - cached[0] >= _STATUS_TTL
+        )
+        if stale:
+            async with _status_lock:
+                # Re-check: another request may have rebuilt while we waited
+                cached = _status_cache
+                if cached is None or time.monotonic() - cached[0] >= _STATUS_TTL:
+                    cached = _make_status_cache_entry(_build_status())
+                    _status_cache = cached
         
-        # Add current test run if any
-        if app_state.test_runner:
-            try:
-                current_run = app_state.test_runner.get_current_run()
-                if current_run:
-                    response["current_run"] = {
-                        "run_id": current_run.run_id,
-                        "total_tests": current_run.total_tests,
-                        "passed": current_run.passed_tests,
-                        "failed": current_run.failed_tests,
-                        "errors": current_run.error_tests,
-                    }
-            except Exception:
-                pass
+        _, body, etag = cached
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=_cache_headers(etag, "no-cache"))
         
-        # Add error if not ready
-        if app_state.initialization_error:
-            response["error"] = app_state.initialization_error
+        # Calculate uptime
+        uptime_seconds = time.monotonic() - _start_time
         
-        return response
+        # body is a JSON object: drop its closing brace, append the
+        # per-request fields
+        content = b"%s,\"timestamp\":\"%s\",\"uptime_seconds\":%s}" % (
+            body[:-1], _iso_timestamp().encode(), repr(uptime_seconds).encode(),
+        )
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers=_cache_headers(etag, "no-cache"),
+        )
 
     # =================================================================
     # Snapshot Endpoints (Phase 6 - A/B Testing)
@@ -456,54 +601,77 @@ def _register_routes(app: FastAPI) -> None:
 
     @app.get("/snapshots", tags=["A/B Testing"])
     async def list_snapshots(
+        request: Request,
         sort_by: str = "captured_at",
         reverse: bool = True,
-    ) -> Dict[str, Any]:
+    ) -> Response:
         """
         List available test run snapshots.
 
         Returns metadata for all captured snapshots, sorted by the
         specified field. Used to identify baselines and candidates
-        for A/B comparison.
+        for A/B comparison. The encoded listing is reused until the
+        snapshot manager's listing signature changes, and a matching
+        If-None-Match gets 304 Not Modified.
         """
-        if not app_state.snapshot_manager:
-            return JSONResponse(
+        snapshot_manager = app_state.snapshot_manager
+        if not snapshot_manager:
+            return FastJSONResponse(
                 status_code=503,
                 content={"error": "Snapshot manager not initialized"},
             )
 
-        snapshots = app_state.snapshot_manager.list_snapshots(
-            sort_by=sort_by, reverse=reverse,
-        )
+        cache_key = (sort_by, reverse)
+        signature = (snapshot_manager, snapshot_manager.get_listing_signature())
+        cached = _snapshot_list_bodies.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return _conditional_response(
+                request, cached[1], cached[2], LISTING_CACHE_CONTROL,
+            )
 
-        return {
+        # Re-reading snapshot files is blocking disk I/O; keep it off the loop
+        snapshots = await asyncio.to_thread(
+            snapshot_manager.list_snapshots, sort_by=sort_by, reverse=reverse,
+        )
+        body = dumps_json({
             "total": len(snapshots),
             "snapshots": [s.to_dict() for s in snapshots],
-            "snapshot_dir": app_state.snapshot_manager.get_snapshot_dir(),
-        }
+            "snapshot_dir": snapshot_manager.get_snapshot_dir(),
+        })
+
+        etag = _make_etag(body)
+
+        # sort_by is client-supplied, so keep the cache bounded
+        if len(_snapshot_list_bodies) >= MAX_SNAPSHOT_LIST_BODIES:
+            _snapshot_list_bodies.clear()
+        _snapshot_list_bodies[cache_key] = (signature, body, etag)
+
+        return _conditional_response(request, body, etag, LISTING_CACHE_CONTROL)
 
     @app.post("/snapshots/capture", tags=["A/B Testing"])
     async def capture_snapshot(
+        background_tasks: BackgroundTasks,
         label: str,
         description: str = "",
         nlp_version: str = "",
         nlp_git_commit: str = "",
-    ) -> Dict[str, Any]:
+    ) -> Response:
         """
         Capture a snapshot from the most recent test run.
 
-        Requires that a test run has been completed. Saves the
-        complete results as a versioned JSON snapshot for future
-        A/B comparison.
+        Requires that a test run has been completed. Returns 202 with a
+        capture job_id immediately; analysis and saving the versioned JSON
+        snapshot happen in the background. Poll
+        /snapshots/{job_id}/status for the result.
         """
         if not app_state.snapshot_manager:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=503,
                 content={"error": "Snapshot manager not initialized"},
             )
 
         if not app_state.test_runner:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=503,
                 content={"error": "Test runner not initialized"},
             )
@@ -511,108 +679,394 @@ def _register_routes(app: FastAPI) -> None:
         # Get most recent test run
         current_run = app_state.test_runner.get_current_run()
         if not current_run:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=404,
                 content={
                     "error": "No completed test run available to capture",
                 },
             )
 
-        # We need an analysis result too - lazy import to avoid circular
-        from src.managers import create_result_analyzer_manager
-
-        analyzer = create_result_analyzer_manager(
-            config_manager=app_state.config_manager,
-            logging_manager=app_state.logging_manager,
-        )
-        analysis = analyzer.analyze(current_run)
+        # Analysis and the snapshot write run after the response is sent
+        job_id = uuid.uuid4().hex
+        _capture_jobs[job_id] = {
+            "job_id": job_id,
+            "status": "queued",
+            "label": label,
+            "filepath": None,
+            "overall_accuracy": current_run.overall_accuracy,
+            "total_phrases": current_run.total_tests,
+            "error": None,
+        }
+        while len(_capture_jobs) > MAX_CAPTURE_JOBS:
+            _capture_jobs.popitem(last=False)
 
-        # Capture the snapshot
-        filepath = app_state.snapshot_manager.capture_snapshot(
-            test_run_summary=current_run,
-            analysis_result=analysis,
+        background_tasks.add_task(
+            _run_capture_job,
+            job_id,
+            current_run,
             label=label,
             description=description,
             nlp_version=nlp_version,
             nlp_git_commit=nlp_git_commit,
         )
 
-        return {
-            "status": "captured",
-            "filepath": filepath,
-            "label": label,
-            "overall_accuracy": current_run.overall_accuracy,
-            "total_phrases": current_run.total_tests,
-        }
+        return FastJSONResponse(
+            status_code=202,
+            content={
+                **_capture_jobs[job_id],
+                "status_url": f"/snapshots/{job_id}/status",
+            },
+        )
+
+    @app.get(
+        "/snapshots/{job_id}/status",
+        tags=["A/B Testing"],
+        response_model=None,
+    )
+    async def get_capture_status(
+        job_id: str,
+    ) -> Union[Dict[str, Any], Response]:
+        """
+        Get the state of a snapshot capture job.
+
+        job_id is the capture job id returned by POST /snapshots/capture,
+        not a snapshot filename.
+
+        Status is one of queued, running, captured or failed. Once
+        captured, filepath points at the saved snapshot.
+        """
+        job = _capture_jobs.get(job_id)
+        if job is None:
+            return FastJSONResponse(
+                status_code=404,
+                content={"error": f"Unknown snapshot capture job: {job_id}"},
+            )
+
+        # Copy - the background task keeps updating the live entry
+        return dict(job)
 
     # =================================================================
     # Comparison Endpoints (Phase 6 - A/B Testing)
     # =================================================================
 
-    @app.post("/comparisons/compare", tags=["A/B Testing"])
+    @app.post("/comparisons/compare", tags=["A/B Testing"], response_model=None)
     async def compare_snapshots(
         baseline_path: str,
         candidate_path: str,
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], Response]:
         """
         Compare two snapshots side-by-side (A/B analysis).
 
         Loads the specified baseline and candidate snapshots, then
         runs the comparison analyzer to produce per-category deltas,
         per-phrase changes, latency comparison, and an overall verdict.
+        Results are cached until either snapshot file changes.
         """
         if not app_state.snapshot_manager:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=503,
                 content={"error": "Snapshot manager not initialized"},
             )
 
         if not app_state.comparison_analyzer:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=503,
                 content={"error": "Comparison analyzer not initialized"},
             )
 
+        # Load both in worker threads so one file's read overlaps the
+        # other's parse, and neither blocks the event loop
+        load_snapshot = app_state.snapshot_manager.load_snapshot
         try:
-            baseline = app_state.snapshot_manager.load_snapshot(
-                baseline_path
-            )
-            candidate = app_state.snapshot_manager.load_snapshot(
-                candidate_path
+            baseline, candidate = await asyncio.gather(
+                asyncio.to_thread(load_snapshot, baseline_path),
+                asyncio.to_thread(load_snapshot, candidate_path),
             )
         except FileNotFoundError as e:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=404,
                 content={"error": str(e)},
             )
         except (ValueError, Exception) as e:
-            return JSONResponse(
+            return FastJSONResponse(
                 status_code=400,
                 content={"error": f"Invalid snapshot: {e}"},
             )
 
+        cache_key = (
+            baseline.filepath, baseline.source_mtime_ns,
+            candidate.filepath, candidate.source_mtime_ns,
+        )
+        cached = _comparison_cache.get(cache_key)
+        if cached is not None:
+            _comparison_cache.move_to_end(cache_key)
+            # The cached payload is shared; stamp a copy with this request
+            return {**cached, "compared_at": datetime.now().isoformat()}
+
         result = app_state.comparison_analyzer.compare(
             baseline_snapshot=baseline,
             candidate_snapshot=candidate,
-        )
+        ).to_dict()
+
+        _comparison_cache[cache_key] = result
+        while len(_comparison_cache) > COMPARISON_CACHE_SIZE:
+            _comparison_cache.popitem(last=False)
 
-        return result.to_dict()
+        return result
 
     @app.get("/comparisons/thresholds", tags=["A/B Testing"])
-    async def get_comparison_thresholds() -> Dict[str, Any]:
+    async def get_comparison_thresholds(request: Request) -> Response:
         """
         Get current comparison verdict thresholds.
 
         Returns the configured regression thresholds and critical
-        categories that determine PASS/WARN/FAIL verdicts.
+        categories that determine PASS/WARN/FAIL verdicts. Supports
+        If-None-Match / 304 Not Modified.
         """
-        if not app_state.comparison_analyzer:
-            return JSONResponse(
+        global _thresholds_body
+
+        analyzer = app_state.comparison_analyzer
+        if not analyzer:
+            return FastJSONResponse(
                 status_code=503,
                 content={"error": "Comparison analyzer not initialized"},
             )
 
-        return app_state.comparison_analyzer.get_thresholds()
+        # Thresholds are fixed when the analyzer is constructed, so the
+        # encoded body is only rebuilt if the analyzer is replaced
+        cached_analyzer, body, etag = _thresholds_body
+        if cached_analyzer is not analyzer:
+            body = dumps_json(analyzer.get_thresholds())
+            etag = _make_etag(body)
+            _thresholds_body = (analyzer, body, etag)
+
+        return _conditional_response(request, body, etag, LISTING_CACHE_CONTROL)
+
+
+def _iso_timestamp() -> str:
+    """
+    Current local time as a second-resolution ISO 8601 string.
+    
+    Formatted at most once per second; every other call in the same
+    second returns the cached string.
+    """
+    return _iso_time.format(time.time())
+
+
+def _run_capture_job(
+    job_id: str,
+    current_run: Any,
+    label: str,
+    description: str,
+    nlp_version: str,
+    nlp_git_commit: str,
+) -> None:
+    """
+    Analyze a test run and save it as a snapshot (background task).
+
+    Runs in Starlette's threadpool after the capture response is sent and
+    records progress on the job in _capture_jobs.
+    """
+    job = _capture_jobs.get(job_id, {})
+    job["status"] = "running"
+
+    try:
+        analyzer = app_state.result_analyzer
+        if analyzer is None:
+            # Not built at startup (e.g. partial injection) - lazy import
+            # to avoid circular, then keep it for later captures
+            from src.managers import create_result_analyzer_manager
+
+            analyzer = create_result_analyzer_manager(
+                config_manager=app_state.config_manager,
+                logging_manager=app_state.logging_manager,
+            )
+            app_state.result_analyzer = analyzer
+            # /status froze its components map without the analyzer
+            app_state._components_snapshot = None
+        analysis = analyzer.analyze(current_run)
+
+        job["filepath"] = app_state.snapshot_manager.capture_snapshot(
+            test_run_summary=current_run,
+            analysis_result=analysis,
+            label=label,
+            description=description,
+            nlp_version=nlp_version,
+            nlp_git_commit=nlp_git_commit,
+        )
+        job["status"] = "captured"
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = str(e)
+        logger.error("❌ Snapshot capture %s failed: %s", job_id, e)
+
+
+async def _refresh_status_loop() -> None:
+    """
+    Rebuild the /status cache every _STATUS_TTL seconds.
+    
+    Runs _build_status() in a worker thread so slow manager calls
+    (phrase statistics, NLP client status) never block the event loop.
+    """
+    global _status_cache
+    
+    while True:
+        try:
+            status = await asyncio.to_thread(_build_status)
+            _status_cache = _make_status_cache_entry(status)
+        except Exception as e:
+            logger.warning("⚠️ Status refresh failed: %s", e)
+        await asyncio.sleep(_STATUS_TTL)
+
+
+def _make_etag(body: bytes, weak: bool = False) -> str:
+    """
+    ETag (quoted 8-byte blake2b hex digest) for a response body.
+    
+    Pass weak=True when the bytes sent can differ from body (e.g. /status
+    splices per-request fields in), since a strong validator must only
+    ever label one exact representation.
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    return f"W/{etag}" if weak else etag
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag.
+    
+    Uses the weak comparison If-None-Match calls for (RFC 9110 13.1.2):
+    the header may list several comma-separated tags, W/ prefixes are
+    ignored on both sides, and "*" matches any current representation.
+    """
+    if not if_none_match:
+        return False
+    
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque_tag:
+            return True
+    return False
+
+
+def _cache_headers(etag: str, cache_control: str) -> Dict[str, str]:
+    """Validator and caching headers for a cacheable JSON response."""
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def _conditional_response(
+    request: Request, body: bytes, etag: str, cache_control: str,
+) -> Response:
+    """
+    Return 304 Not Modified if the client already has this body, else the
+    JSON body, with ETag and Cache-Control headers on both.
+    """
+    headers = _cache_headers(etag, cache_control)
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _make_status_cache_entry(status: Dict[str, Any]) -> Tuple[float, bytes, str]:
+    """
+    Serialize a built /status payload and stamp it with build time and ETag.
+    
+    The ETag is weak: it covers this body, but every response also carries
+    its own timestamp and uptime.
+    """
+    body = dumps_json(status)
+    return (time.monotonic(), body, _make_etag(body, weak=True))
+
+
+def _build_status() -> Dict[str, Any]:
+    """
+    Build the /status payload from the current manager state.
+    
+    timestamp and uptime_seconds are not included; detailed_status appends
+    them per request.
+    """
+    # Bind managers to locals once instead of re-reading the global
+    state = app_state
+    phrase_loader = state.phrase_loader
+    nlp_client = state.nlp_client
+    test_runner = state.test_runner
+    initialization_error = state.initialization_error
+    
+    # Base response
+    response: Dict[str, Any] = {
+        "service": SERVICE_NAME,
+        "version": SERVICE_VERSION,
+        "status": "ready" if state.is_ready else "initializing",
+        "started_at": _start_datetime_iso,
+    }
+    
+    # Add component status - managers aren't swapped once ready, so the
+    # map is built once then and shared (read-only) by later responses
+    components = state._components_snapshot
+    if components is None:
+        components = {
+            name: getattr(state, name) is not None
+            for name in STATUS_COMPONENTS
+        }
+        if state.is_ready:
+            state._components_snapshot = components
+    response["components"] = components
+    
+    # Add phrase statistics if available
+    if phrase_loader:
+        try:
+            stats = phrase_loader.get_statistics()
+            response["phrases"] = {
+                "total": stats.total_phrases,
+                "files_loaded": stats.files_loaded,
+                "categories": list(stats.by_category.keys()),
+            }
+        except Exception as e:
+            response["phrases"] = {"error": str(e)}
+    
+    # Add NLP client status if available
+    if nlp_client:
+        try:
+            response["nlp_client"] = nlp_client.get_status_info()
+        except Exception as e:
+            response["nlp_client"] = {"error": str(e)}
+    
+    # Add current test run if any
+    if test_runner:
+        try:
+            current_run = test_runner.get_current_run()
+            if current_run:
+                response["current_run"] = {
+                    "run_id": current_run.run_id,
+                    "total_tests": current_run.total_tests,
+                    "passed": current_run.passed_tests,
+                    "failed": current_run.failed_tests,
+                    "errors": current_run.error_tests,
+                }
+        except Exception:
+            pass
+    
+    # Add error if not ready
+    if initialization_error:
+        response["error"] = initialization_error
+    
+    return response
+
+
+# =============================================================================
+# Warm-up
+# =============================================================================
+
+# Exercise the response/encoder paths used by /health and /status once at
+# import, before uvicorn accepts traffic, so the first probe after a deploy
+# doesn't pay for it
+FastJSONResponse(content={"status": "ok", "timestamp": _iso_timestamp()})
+Response(content=_HEALTH_OK_PREFIX + _HEALTH_OK_SUFFIX, media_type="application/json")
 
 
 # =============================================================================
@@ -624,6 +1078,9 @@ __all__ = [
     "get_app",
     "app_state",
     "AppState",
+    "InjectedManagers",
+    "FastJSONResponse",
     "SERVICE_NAME",
     "SERVICE_VERSION",
+    "SERVICE_INFO",
 ]
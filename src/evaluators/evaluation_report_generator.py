@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Evaluation Report Generator - Model Comparison Reports for Ash-Vigil
 ----------------------------------------------------------------------------
-FILE VERSION: v5.1-1-1.7-1
-LAST MODIFIED: 2026-02-12
+FILE VERSION: v5.1-1-1.7-2
+LAST MODIFIED: 2026-10-18
 PHASE: Phase 1 - Unified Vigil Evaluation
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
@@ -54,7 +54,6 @@ USAGE:
     reporter.generate_comparison_report(comparison)
 """
 
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -63,6 +62,9 @@ from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
+from src.utils.file_utils import DirectoryNameListing
+from src.utils.json_utils import dump_json_file, load_json_file
+
 from .vigil_evaluator import (
     EvaluationResult,
     EvaluationStatus,
@@ -72,7 +74,7 @@ from .vigil_evaluator import (
 )
 
 # Module version
-__version__ = "v5.1-1-1.7-1"
+__version__ = "v5.1-1-1.7-2"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -93,6 +95,10 @@ COMPARISON_JSON_PATTERN = "vigil_comparison_{timestamp}.json"
 COMPARISON_HTML_PATTERN = "vigil_comparison_{timestamp}.html"
 BASELINE_PATTERN = "baseline_{name}.json"
 
+# BASELINE_PATTERN split around {name}, for parsing names back out
+BASELINE_PREFIX = "baseline_"
+BASELINE_SUFFIX = ".json"
+
 
 # =============================================================================
 # Data Classes
@@ -233,6 +239,11 @@ class EvaluationReportGenerator:
         self._report_dir = Path(self._resolve_report_dir(report_dir))
         self._baseline_dir = Path(self._resolve_baseline_dir(baseline_dir))
         
+        # Baseline names, re-scanned only when the directory's mtime changes
+        self._baseline_listing = DirectoryNameListing(
+            self._baseline_dir, BASELINE_PREFIX, BASELINE_SUFFIX, self._logger
+        )
+        
         # Initialize Jinja2 environment
         self._jinja_env = self._setup_jinja_environment()
         
@@ -354,8 +365,7 @@ class EvaluationReportGenerator:
         output_path = self._report_dir / filename
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            dump_json_file(report, output_path)
             
             self._logger.info(f"📄 JSON evaluation report saved: {output_path}")
             return output_path
@@ -613,8 +623,7 @@ class EvaluationReportGenerator:
         }
         
         json_path = self._report_dir / json_filename
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_report, f, indent=2, ensure_ascii=False)
+        dump_json_file(json_report, json_path)
         
         # Generate HTML
         if html_filename is None:
@@ -674,8 +683,8 @@ class EvaluationReportGenerator:
         }
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(baseline_data, f, indent=2, ensure_ascii=False)
+            dump_json_file(baseline_data, output_path)
+            self._baseline_listing.invalidate()
             
             self._logger.info(f"💾 Baseline '{name}' saved: {output_path}")
             return output_path
@@ -697,13 +706,8 @@ class EvaluationReportGenerator:
         filename = BASELINE_PATTERN.format(name=name)
         filepath = self._baseline_dir / filename
         
-        if not filepath.exists():
-            self._logger.warning(f"⚠️ Baseline '{name}' not found: {filepath}")
-            return None
-        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(filepath)
             
             evaluation = EvaluationResult.from_dict(data["evaluation"])
             self._logger.info(
@@ -711,22 +715,16 @@ class EvaluationReportGenerator:
             )
             return evaluation
             
+        except FileNotFoundError:
+            self._logger.warning(f"⚠️ Baseline '{name}' not found: {filepath}")
+            return None
         except Exception as e:
             self._logger.error(f"❌ Failed to load baseline '{name}': {e}")
             return None
     
     def list_baselines(self) -> List[str]:
-        """List all available baseline names."""
-        baselines = []
-        
-        try:
-            for filepath in self._baseline_dir.glob("baseline_*.json"):
-                name = filepath.stem.replace("baseline_", "")
-                baselines.append(name)
-        except Exception as e:
-            self._logger.warning(f"⚠️ Failed to list baselines: {e}")
-        
-        return sorted(baselines)
+        """List all available baseline names (re-scanned on mtime change)."""
+        return self._baseline_listing.names()
     
     # =========================================================================
     # Embedded Templates
@@ -13,8 +13,8 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Vigil Evaluator - Model Evaluation via Ash-Vigil /evaluate Endpoint
 ----------------------------------------------------------------------------
-FILE VERSION: v5.1-1-1.2-2
-LAST MODIFIED: 2026-02-12
+FILE VERSION: v5.1-1-1.2-3
+LAST MODIFIED: 2026-10-18
 PHASE: Phase 1 - Unified Vigil Evaluation
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
@@ -57,19 +57,21 @@ USAGE:
 """
 
 import asyncio
-import json
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import httpx
 
+from src.utils.json_utils import load_json_file
+
 # Module version
-__version__ = "v5.1-1-1.2-2"
+__version__ = "v5.1-1-1.2-3"
 
 # Initialize logger (will be replaced by LoggingConfigManager logger)
 logger = logging.getLogger(__name__)
@@ -86,6 +88,7 @@ DEFAULT_TIMEOUT = 120  # Seconds - batch evaluation can take time
 DEFAULT_RETRY_ATTEMPTS = 2
 DEFAULT_RETRY_DELAY_MS = 2000
 DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_CONCURRENT_BATCHES = 1  # Batch requests in flight at once
 
 # API endpoints
 ENDPOINT_HEALTH = "/health"
@@ -139,6 +142,13 @@ RISK_LEVEL_MAP = {
     "safe": ["none", "low"],                # Normal
 }
 
+# Ordinal rank of Vigil risk levels (higher = more severe), for escalation checks
+RISK_LEVEL_RANK = {
+    "safe": 0,
+    "moderate_risk": 1,
+    "high_risk": 2,
+}
+
 # Expected priority mapping for evaluation
 EXPECTED_PRIORITY_TO_VIGIL = {
     "critical": "high_risk",
@@ -170,6 +180,15 @@ class PassStatus(str, Enum):
     ESCALATED = "escalated"  # Higher risk than expected (acceptable)
 
 
+# Counter key used for each pass status in accuracy breakdowns
+PASS_STATUS_COUNT_KEYS = {
+    PassStatus.PASS: "passed",
+    PassStatus.FAIL: "failed",
+    PassStatus.ERROR: "errors",
+    PassStatus.ESCALATED: "escalated",
+}
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -184,9 +203,14 @@ class TestPhrase:
     expected_priorities: List[str]
     description: str = ""
     
-    @property
+    @cached_property
     def expected_risk_levels(self) -> List[str]:
-        """Convert expected priorities to Vigil risk levels."""
+        """
+        Convert expected priorities to Vigil risk levels.
+        
+        Computed once per phrase and cached: it is read several times per
+        evaluation and phrases are reused across runs via the phrase cache.
+        """
         risk_levels = set()
         for priority in self.expected_priorities:
             if priority in EXPECTED_PRIORITY_TO_VIGIL:
@@ -435,6 +459,7 @@ class VigilEvaluator:
         vigil_port: Ash-Vigil server port
         timeout: Request timeout in seconds
         batch_size: Number of phrases per batch request
+        max_concurrent_batches: Number of batch requests in flight at once
     
     Example:
         >>> evaluator = create_vigil_evaluator(config_manager=config)
@@ -456,6 +481,7 @@ class VigilEvaluator:
         batch_size: int = DEFAULT_BATCH_SIZE,
         phrases_base_path: Optional[str] = None,
         logger_instance: Optional[logging.Logger] = None,
+        max_concurrent_batches: int = DEFAULT_MAX_CONCURRENT_BATCHES,
     ):
         """
         Initialize the VigilEvaluator.
@@ -469,6 +495,7 @@ class VigilEvaluator:
             batch_size: Number of phrases per batch request
             phrases_base_path: Base path to phrase files (default: auto-detect)
             logger_instance: Optional custom logger
+            max_concurrent_batches: Number of batch requests in flight at once
         
         Note:
             Use create_vigil_evaluator() factory function instead.
@@ -480,6 +507,7 @@ class VigilEvaluator:
         self.retry_attempts = retry_attempts
         self.retry_delay_ms = retry_delay_ms
         self.batch_size = batch_size
+        self.max_concurrent_batches = max(1, int(max_concurrent_batches))
         
         # Resolve phrases base path
         self._phrases_base_path = self._resolve_phrases_path(phrases_base_path)
@@ -495,7 +523,8 @@ class VigilEvaluator:
         
         self._logger.debug(
             f"VigilEvaluator {__version__} initialized "
-            f"(base_url: {self.base_url}, timeout: {timeout}s, batch_size: {batch_size})"
+            f"(base_url: {self.base_url}, timeout: {timeout}s, batch_size: {batch_size}, "
+            f"max_concurrent_batches: {self.max_concurrent_batches})"
         )
     
     def _resolve_phrases_path(self, override: Optional[str]) -> Path:
@@ -661,13 +690,8 @@ class VigilEvaluator:
         """Load test phrases from a JSON file."""
         full_path = self._phrases_base_path / filepath
         
-        if not full_path.exists():
-            self._logger.warning(f"⚠️ Phrase file not found: {full_path}")
-            return []
-        
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(full_path)
             
             phrases = []
             phrase_index = 0
@@ -708,6 +732,9 @@ class VigilEvaluator:
             )
             return phrases
             
+        except FileNotFoundError:
+            self._logger.warning(f"⚠️ Phrase file not found: {full_path}")
+            return []
         except Exception as e:
             self._logger.error(f"❌ Failed to load phrases from {filepath}: {e}")
             return []
@@ -806,21 +833,18 @@ class VigilEvaluator:
         if actual_risk_level in expected_risk_levels:
             return PassStatus.PASS
         
-        # Check for escalation (higher risk than expected)
+        # Check for escalation (higher risk than expected). Unknown levels
+        # rank -1, so an unknown actual level or no known expected level
+        # can never count as an escalation.
         if allow_escalation:
-            risk_order = ["safe", "moderate_risk", "high_risk"]
+            actual_rank = RISK_LEVEL_RANK.get(actual_risk_level, -1)
+            max_expected_rank = max(
+                (RISK_LEVEL_RANK.get(r, -1) for r in expected_risk_levels),
+                default=-1,
+            )
             
-            try:
-                actual_idx = risk_order.index(actual_risk_level)
-                max_expected_idx = max(
-                    risk_order.index(r) for r in expected_risk_levels
-                    if r in risk_order
-                )
-                
-                if actual_idx > max_expected_idx:
-                    return PassStatus.ESCALATED
-            except ValueError:
-                pass
+            if max_expected_rank >= 0 and actual_rank > max_expected_rank:
+                return PassStatus.ESCALATED
         
         return PassStatus.FAIL
     
@@ -936,6 +960,42 @@ class VigilEvaluator:
         
         return results
     
+    async def _evaluate_batches(
+        self,
+        phrases: List[TestPhrase],
+        on_batch_complete: Optional[Callable[[List[PhraseResult]], None]] = None,
+    ) -> List[PhraseResult]:
+        """
+        Evaluate phrases in batch_size chunks with bounded concurrency.
+        
+        Up to max_concurrent_batches requests share the pooled HTTP client
+        at once, so Vigil round-trip latency overlaps instead of adding up.
+        
+        Args:
+            phrases: Phrases to evaluate
+            on_batch_complete: Optional callback invoked with each batch's
+                results as soon as that batch finishes
+        
+        Returns:
+            Phrase results in the same order as the input phrases
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+        
+        async def run_batch(batch: List[TestPhrase]) -> List[PhraseResult]:
+            async with semaphore:
+                batch_results = await self._evaluate_batch(batch)
+            if on_batch_complete:
+                on_batch_complete(batch_results)
+            return batch_results
+        
+        batches = [
+            phrases[i:i + self.batch_size]
+            for i in range(0, len(phrases), self.batch_size)
+        ]
+        batch_results = await asyncio.gather(*(run_batch(b) for b in batches))
+        
+        return [r for results in batch_results for r in results]
+    
     def _calculate_category_accuracy(
         self,
         category: str,
@@ -951,34 +1011,33 @@ class VigilEvaluator:
         Returns:
             CategoryAccuracy with calculated metrics
         """
-        passed = sum(1 for r in results if r.status == PassStatus.PASS)
-        failed = sum(1 for r in results if r.status == PassStatus.FAIL)
-        errors = sum(1 for r in results if r.status == PassStatus.ERROR)
-        escalated = sum(1 for r in results if r.status == PassStatus.ESCALATED)
-        
-        total = len(results)
-        accuracy = ((passed + escalated) / total * 100) if total > 0 else 0.0
-        
-        # Calculate subcategory breakdown
+        # Single pass over results: status counts, subcategory breakdown
+        # and timing are accumulated together rather than re-scanning the
+        # list once per metric.
+        counts = {"passed": 0, "failed": 0, "errors": 0, "escalated": 0}
         subcategory_breakdown: Dict[str, Dict[str, int]] = {}
+        total_time = 0.0
+        
         for result in results:
-            if result.subcategory not in subcategory_breakdown:
-                subcategory_breakdown[result.subcategory] = {
+            key = PASS_STATUS_COUNT_KEYS[result.status]
+            counts[key] += 1
+            total_time += result.inference_time_ms
+            
+            breakdown = subcategory_breakdown.get(result.subcategory)
+            if breakdown is None:
+                breakdown = subcategory_breakdown[result.subcategory] = {
                     "total": 0, "passed": 0, "failed": 0, "errors": 0, "escalated": 0
                 }
-            
-            subcategory_breakdown[result.subcategory]["total"] += 1
-            if result.status == PassStatus.PASS:
-                subcategory_breakdown[result.subcategory]["passed"] += 1
-            elif result.status == PassStatus.FAIL:
-                subcategory_breakdown[result.subcategory]["failed"] += 1
-            elif result.status == PassStatus.ERROR:
-                subcategory_breakdown[result.subcategory]["errors"] += 1
-            elif result.status == PassStatus.ESCALATED:
-                subcategory_breakdown[result.subcategory]["escalated"] += 1
+            breakdown["total"] += 1
+            breakdown[key] += 1
+        
+        passed = counts["passed"]
+        failed = counts["failed"]
+        errors = counts["errors"]
+        escalated = counts["escalated"]
         
-        # Calculate timing
-        total_time = sum(r.inference_time_ms for r in results)
+        total = len(results)
+        accuracy = ((passed + escalated) / total * 100) if total > 0 else 0.0
         avg_time = total_time / total if total > 0 else 0.0
         
         return CategoryAccuracy(
@@ -1067,36 +1126,48 @@ class VigilEvaluator:
                 result.status_message = "No phrases loaded"
                 return result
             
-            all_results: List[PhraseResult] = []
-            
             # Calculate total phrase count for progress reporting
             total_phrase_count = sum(len(p) for p in phrases_by_category.values())
             completed_count = 0
             
-            # Evaluate each category
-            for category, phrases in phrases_by_category.items():
-                self._logger.info(f"📊 Evaluating category: {category} ({len(phrases)} phrases)")
+            def on_batch_complete(batch_results: List[PhraseResult]) -> None:
+                nonlocal completed_count
                 
-                # Process in batches
-                for i in range(0, len(phrases), self.batch_size):
-                    batch = phrases[i:i + self.batch_size]
-                    batch_results = await self._evaluate_batch(batch)
-                    all_results.extend(batch_results)
-                    
-                    # Invoke progress callback for each result in batch
+                # Invoke progress callback for each result in batch
+                for batch_result in batch_results:
+                    completed_count += 1
                     if progress_callback:
-                        for batch_result in batch_results:
-                            completed_count += 1
-                            progress_callback(completed_count, total_phrase_count, batch_result)
-                    else:
-                        completed_count += len(batch_results)
-                    
-                    # Log progress
-                    progress = min(i + self.batch_size, len(phrases))
-                    self._logger.debug(f"  Processed {progress}/{len(phrases)} phrases")
+                        progress_callback(completed_count, total_phrase_count, batch_result)
                 
-                # Calculate category accuracy
-                category_results = [r for r in all_results if r.category == category]
+                self._logger.debug(
+                    f"  Processed {completed_count}/{total_phrase_count} phrases"
+                )
+            
+            # Pack phrases from all categories into full batch_size requests
+            # rather than batching per category, so small categories do not
+            # each cost a mostly-empty /evaluate round trip
+            self._logger.info(
+                f"📊 Evaluating {total_phrase_count} phrases across "
+                f"{len(phrases_by_category)} categories"
+            )
+            for category, phrases in phrases_by_category.items():
+                self._logger.debug(f"  {category}: {len(phrases)} phrases")
+            
+            all_phrases = [
+                phrase
+                for phrases in phrases_by_category.values()
+                for phrase in phrases
+            ]
+            all_results = await self._evaluate_batches(
+                all_phrases, on_batch_complete=on_batch_complete
+            )
+            
+            # Results come back in input order, so each category is a
+            # contiguous slice
+            offset = 0
+            for category, phrases in phrases_by_category.items():
+                category_results = all_results[offset:offset + len(phrases)]
+                offset += len(phrases)
                 result.category_accuracies[category] = self._calculate_category_accuracy(
                     category, category_results
                 )
@@ -1104,12 +1175,14 @@ class VigilEvaluator:
             # Store all results
             result.phrase_results = all_results
             
-            # Calculate overall metrics
+            # Overall metrics roll up from the per-category counts already
+            # computed above, so the full result list is not re-scanned
+            category_accuracies = result.category_accuracies.values()
             result.total_phrases = len(all_results)
-            result.total_passed = sum(1 for r in all_results if r.status == PassStatus.PASS)
-            result.total_failed = sum(1 for r in all_results if r.status == PassStatus.FAIL)
-            result.total_errors = sum(1 for r in all_results if r.status == PassStatus.ERROR)
-            result.total_escalated = sum(1 for r in all_results if r.status == PassStatus.ESCALATED)
+            result.total_passed = sum(c.passed for c in category_accuracies)
+            result.total_failed = sum(c.failed for c in category_accuracies)
+            result.total_errors = sum(c.errors for c in category_accuracies)
+            result.total_escalated = sum(c.escalated for c in category_accuracies)
             
             if result.total_phrases > 0:
                 result.overall_accuracy = (
@@ -1118,7 +1191,9 @@ class VigilEvaluator:
                 result.overall_pass_rate = result.overall_accuracy
             
             # Calculate timing
-            result.total_inference_time_ms = sum(r.inference_time_ms for r in all_results)
+            result.total_inference_time_ms = sum(
+                c.total_inference_time_ms for c in category_accuracies
+            )
             result.average_inference_time_ms = (
                 result.total_inference_time_ms / result.total_phrases
                 if result.total_phrases > 0 else 0.0
@@ -1161,14 +1236,7 @@ class VigilEvaluator:
         Returns:
             List of PhraseResult objects
         """
-        all_results = []
-        
-        for i in range(0, len(phrases), self.batch_size):
-            batch = phrases[i:i + self.batch_size]
-            batch_results = await self._evaluate_batch(batch)
-            all_results.extend(batch_results)
-        
-        return all_results
+        return await self._evaluate_batches(phrases)
     
     # =========================================================================
     # Context Manager
@@ -1193,6 +1261,7 @@ class VigilEvaluator:
             "vigil_url": self.base_url,
             "timeout": self.timeout,
             "batch_size": self.batch_size,
+            "max_concurrent_batches": self.max_concurrent_batches,
             "phrases_path": str(self._phrases_base_path),
             "cached_categories": list(self._phrase_cache.keys()),
             "client_open": self._client is not None and not self._client.is_closed,
@@ -1213,6 +1282,7 @@ def create_vigil_evaluator(
     phrases_base_path: Optional[str] = None,
     config_manager: Optional[Any] = None,
     logging_manager: Optional[Any] = None,
+    max_concurrent_batches: Optional[int] = None,
 ) -> VigilEvaluator:
     """
     Factory function for VigilEvaluator (Clean Architecture v5.2.3 Pattern).
@@ -1236,6 +1306,7 @@ def create_vigil_evaluator(
         phrases_base_path: Override path to phrase files
         config_manager: Optional ConfigManager for loading settings
         logging_manager: Optional LoggingConfigManager for custom logger
+        max_concurrent_batches: Concurrent batch request limit override
     
     Returns:
         Configured VigilEvaluator instance
@@ -1319,6 +1390,19 @@ def create_vigil_evaluator(
             except ValueError:
                 batch_size = DEFAULT_BATCH_SIZE
     
+    # Resolve max_concurrent_batches
+    if max_concurrent_batches is None:
+        if config_manager:
+            max_concurrent_batches = config_manager.get("vigil", "max_concurrent_batches")
+        if max_concurrent_batches is None:
+            concurrency_str = os.environ.get(
+                "THRASH_VIGIL_MAX_CONCURRENT_BATCHES", str(DEFAULT_MAX_CONCURRENT_BATCHES)
+            )
+            try:
+                max_concurrent_batches = int(concurrency_str)
+            except ValueError:
+                max_concurrent_batches = DEFAULT_MAX_CONCURRENT_BATCHES
+    
     # Resolve phrases_base_path
     if phrases_base_path is None:
         if config_manager:
@@ -1346,6 +1430,7 @@ def create_vigil_evaluator(
         batch_size=batch_size,
         phrases_base_path=phrases_base_path,
         logger_instance=logger_instance,
+        max_concurrent_batches=max_concurrent_batches,
     )
 
 
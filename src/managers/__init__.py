@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Managers Package for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-6-6.3-3
-LAST MODIFIED: 2026-02-07
-PHASE: Phase 6 - A/B Testing Infrastructure (v5.1 Migration Phase 1)
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -105,145 +105,115 @@ USAGE:
 """
 
 # Module version
-__version__ = "v5.0-6-6.3-3"
+__version__ = "v5.0-6-6.5-1"
 
-# =============================================================================
-# Configuration Manager
-# =============================================================================
-
-from .config_manager import (
-    ConfigManager,
-    create_config_manager,
-)
-
-# =============================================================================
-# Secrets Manager
-# =============================================================================
-
-from .secrets_manager import (
-    SecretsManager,
-    create_secrets_manager,
-    get_secrets_manager,
-    get_secret,
-    SecretNotFoundError,
-    KNOWN_SECRETS,
-)
-
-# =============================================================================
-# Logging Configuration Manager
-# =============================================================================
-
-from .logging_config_manager import (
-    LoggingConfigManager,
-    create_logging_config_manager,
-    SUCCESS_LEVEL,
-    Colors,
-    Symbols,
-)
+import importlib
+from typing import Any, Dict, List
 
 # =============================================================================
-# NLP Client Manager
-# =============================================================================
-
-from .nlp_client_manager import (
-    NLPClientManager,
-    create_nlp_client_manager,
-    AnalyzeRequest,
-    AnalyzeResponse,
-    HealthResponse,
-    AnalyzeVerbosity,
-    NLPClientError,
-    NLPConnectionError,
-    NLPTimeoutError,
-    NLPResponseError,
-)
-
-# =============================================================================
-# Phrase Loader Manager
-# =============================================================================
-
-from .phrase_loader_manager import (
-    PhraseLoaderManager,
-    create_phrase_loader_manager,
-    TestPhrase,
-    CategoryInfo,
-    PhraseStatistics,
-    CATEGORY_DEFINITE,
-    CATEGORY_EDGE_CASE,
-    CATEGORY_SPECIALTY,
-)
-
-# =============================================================================
-# Test Runner Manager (Phase 2)
-# =============================================================================
-
-from .test_runner_manager import (
-    TestRunnerManager,
-    create_test_runner_manager,
-    TestResult,
-    TestRunSummary,
-    TestStatus,
-    ErrorType,
-    ProgressCallback,
-)
-
-# =============================================================================
-# Result Analyzer Manager (Phase 3)
-# =============================================================================
-
-from .result_analyzer_manager import (
-    ResultAnalyzerManager,
-    create_result_analyzer_manager,
-    AnalysisResult,
-    CategoryMetrics,
-    SubcategoryMetrics,
-    LatencyMetrics,
-    FailedTestDetail,
-    ThresholdResult,
-    ThresholdStatus,
-    RegressionSeverity,
-)
-
-# =============================================================================
-# Report Manager (Phase 3)
-# =============================================================================
-
-from .report_manager import (
-    ReportManager,
-    create_report_manager,
-    BaselineComparison,
-    RegressionDetail,
-    ImprovementDetail,
-    ComparisonVerdict,
-)
-
-# =============================================================================
-# Snapshot Manager (Phase 6 - A/B Testing)
+# Lazy Import Table
 # =============================================================================
+# Public names are resolved on first access via module __getattr__ (PEP 562),
+# so importing one factory (e.g. for a /health-only container) does not pull
+# in every manager module and its dependencies (httpx, jinja2, ...).
+
+_LAZY_IMPORTS: Dict[str, str] = {
+    # Configuration Manager
+    "ConfigManager": ".config_manager",
+    "create_config_manager": ".config_manager",
+    # Secrets Manager
+    "SecretsManager": ".secrets_manager",
+    "create_secrets_manager": ".secrets_manager",
+    "get_secrets_manager": ".secrets_manager",
+    "get_secret": ".secrets_manager",
+    "SecretNotFoundError": ".secrets_manager",
+    "KNOWN_SECRETS": ".secrets_manager",
+    # Logging Configuration Manager
+    "LoggingConfigManager": ".logging_config_manager",
+    "create_logging_config_manager": ".logging_config_manager",
+    "SUCCESS_LEVEL": ".logging_config_manager",
+    "Colors": ".logging_config_manager",
+    "Symbols": ".logging_config_manager",
+    # NLP Client Manager
+    "NLPClientManager": ".nlp_client_manager",
+    "create_nlp_client_manager": ".nlp_client_manager",
+    "AnalyzeRequest": ".nlp_client_manager",
+    "AnalyzeResponse": ".nlp_client_manager",
+    "HealthResponse": ".nlp_client_manager",
+    "AnalyzeVerbosity": ".nlp_client_manager",
+    "NLPClientError": ".nlp_client_manager",
+    "NLPConnectionError": ".nlp_client_manager",
+    "NLPTimeoutError": ".nlp_client_manager",
+    "NLPResponseError": ".nlp_client_manager",
+    # Phrase Loader Manager
+    "PhraseLoaderManager": ".phrase_loader_manager",
+    "create_phrase_loader_manager": ".phrase_loader_manager",
+    "TestPhrase": ".phrase_loader_manager",
+    "CategoryInfo": ".phrase_loader_manager",
+    "PhraseStatistics": ".phrase_loader_manager",
+    "CATEGORY_DEFINITE": ".phrase_loader_manager",
+    "CATEGORY_EDGE_CASE": ".phrase_loader_manager",
+    "CATEGORY_SPECIALTY": ".phrase_loader_manager",
+    # Test Runner Manager (Phase 2)
+    "TestRunnerManager": ".test_runner_manager",
+    "create_test_runner_manager": ".test_runner_manager",
+    "TestResult": ".test_runner_manager",
+    "TestRunSummary": ".test_runner_manager",
+    "TestStatus": ".test_runner_manager",
+    "ErrorType": ".test_runner_manager",
+    "ProgressCallback": ".test_runner_manager",
+    # Result Analyzer Manager (Phase 3)
+    "ResultAnalyzerManager": ".result_analyzer_manager",
+    "create_result_analyzer_manager": ".result_analyzer_manager",
+    "AnalysisResult": ".result_analyzer_manager",
+    "CategoryMetrics": ".result_analyzer_manager",
+    "SubcategoryMetrics": ".result_analyzer_manager",
+    "LatencyMetrics": ".result_analyzer_manager",
+    "FailedTestDetail": ".result_analyzer_manager",
+    "ThresholdResult": ".result_analyzer_manager",
+    "ThresholdStatus": ".result_analyzer_manager",
+    "RegressionSeverity": ".result_analyzer_manager",
+    # Report Manager (Phase 3)
+    "ReportManager": ".report_manager",
+    "create_report_manager": ".report_manager",
+    "BaselineComparison": ".report_manager",
+    "RegressionDetail": ".report_manager",
+    "ImprovementDetail": ".report_manager",
+    "ComparisonVerdict": ".report_manager",
+    # Snapshot Manager (Phase 6 - A/B Testing)
+    "SnapshotManager": ".snapshot_manager",
+    "create_snapshot_manager": ".snapshot_manager",
+    "Snapshot": ".snapshot_manager",
+    "SnapshotMetadata": ".snapshot_manager",
+    "SNAPSHOT_SCHEMA_VERSION": ".snapshot_manager",
+    # Comparison Analyzer Manager (Phase 6 - A/B Testing)
+    "ComparisonAnalyzerManager": ".comparison_analyzer_manager",
+    "create_comparison_analyzer_manager": ".comparison_analyzer_manager",
+    "ComparisonResult": ".comparison_analyzer_manager",
+    "CategoryDelta": ".comparison_analyzer_manager",
+    "PhraseChange": ".comparison_analyzer_manager",
+    "LatencyDelta": ".comparison_analyzer_manager",
+    "VERDICT_PASS": ".comparison_analyzer_manager",
+    "VERDICT_WARN": ".comparison_analyzer_manager",
+    "VERDICT_FAIL": ".comparison_analyzer_manager",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
 
-from .snapshot_manager import (
-    SnapshotManager,
-    create_snapshot_manager,
-    Snapshot,
-    SnapshotMetadata,
-    SNAPSHOT_SCHEMA_VERSION,
-)
 
-# =============================================================================
-# Comparison Analyzer Manager (Phase 6 - A/B Testing)
-# =============================================================================
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir() and tab completion."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .comparison_analyzer_manager import (
-    ComparisonAnalyzerManager,
-    create_comparison_analyzer_manager,
-    ComparisonResult,
-    CategoryDelta,
-    PhraseChange,
-    LatencyDelta,
-    VERDICT_PASS,
-    VERDICT_WARN,
-    VERDICT_FAIL,
-)
 
 # =============================================================================
 # Public API
@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Logging Configuration Manager for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-1-1.2-1
-LAST MODIFIED: 2026-01-20
-PHASE: Phase 1 - Foundation
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -50,8 +50,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from src.utils.time_utils import CachedTimeFormatter
+
 # Module version
-__version__ = "v5.0-1-1.2-1"
+__version__ = "v5.0-6-6.5-1"
 
 # =============================================================================
 # Constants
@@ -109,6 +111,10 @@ class Symbols:
 # Custom Formatters
 # =============================================================================
 
+# "YYYY-MM-DD HH:MM:SS" local time, formatted at most once per second
+_record_time = CachedTimeFormatter("%Y-%m-%d %H:%M:%S")
+
+
 class ColorizedFormatter(logging.Formatter):
     """
     Formatter that adds colors and symbols to log output.
@@ -160,7 +166,7 @@ class ColorizedFormatter(logging.Formatter):
             reset = ""
         
         # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _record_time.format(record.created)
         
         # Format level name (padded to 8 chars)
         level_name = record.levelname.ljust(8)
@@ -224,7 +230,7 @@ class PlainFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Format a log record as plain text."""
         # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = _record_time.format(record.created)
         
         # Format level name (padded to 8 chars)
         level_name = record.levelname.ljust(8)
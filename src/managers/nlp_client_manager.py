@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 NLP Client Manager for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-1-1.4-1
-LAST MODIFIED: 2026-01-20
-PHASE: Phase 1 - Foundation
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -51,7 +51,7 @@ from typing import Any, Dict, List, Optional, Union
 import httpx
 
 # Module version
-__version__ = "v5.0-1-1.4-1"
+__version__ = "v5.0-6-6.5-1"
 
 # Initialize logger (will be replaced by LoggingConfigManager logger)
 logger = logging.getLogger(__name__)
@@ -68,6 +68,12 @@ DEFAULT_TIMEOUT = 30
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_DELAY_MS = 1000
 
+# Connection pool limits for the shared AsyncClient. Keep-alive covers the
+# largest test_execution.max_concurrent_tests (32) so concurrent runs reuse
+# sockets instead of reconnecting once httpx's default of 20 is exceeded.
+POOL_MAX_CONNECTIONS = 100
+POOL_MAX_KEEPALIVE_CONNECTIONS = 32
+
 # API endpoints
 ENDPOINT_ANALYZE = "/analyze"
 ENDPOINT_ANALYZE_BATCH = "/analyze/batch"
@@ -292,7 +298,12 @@ class NLPClientManager:
         )
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the async HTTP client."""
+        """
+        Get or create the async HTTP client.
+        
+        One pooled client is shared by every request until close() is
+        called, so keep-alive connections are reused across tests.
+        """
         if self._client is None or self._client.is_closed:
             headers = {
                 "Content-Type": "application/json",
@@ -307,6 +318,10 @@ class NLPClientManager:
                 base_url=self.base_url,
                 timeout=httpx.Timeout(self.timeout),
                 headers=headers,
+                limits=httpx.Limits(
+                    max_connections=POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=POOL_MAX_KEEPALIVE_CONNECTIONS,
+                ),
             )
         return self._client
     
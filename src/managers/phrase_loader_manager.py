@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Phrase Loader Manager for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-2-2.1-2
-LAST MODIFIED: 2026-01-20
-PHASE: Phase 2 - Test Execution Engine (refactored)
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -77,8 +77,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Set, Union
 
+from src.utils.json_utils import load_json_file
+
 # Module version
-__version__ = "v5.0-2-2.1-2"
+__version__ = "v5.0-6-6.5-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -299,26 +301,52 @@ class PhraseLoaderManager:
         self._logger.debug(f"📂 Loading phrases from: {self.phrases_dir}")
         
         # Load definite classification files
+        root_files = self._scan_json_files(self.phrases_dir)
         for filename in DEFINITE_FILES:
-            filepath = self.phrases_dir / filename
-            if filepath.exists():
+            filepath = root_files.get(filename)
+            if filepath is not None:
                 self._load_phrase_file(filepath, CATEGORY_DEFINITE)
         
         # Load edge case files
-        edge_case_dir = self.phrases_dir / EDGE_CASE_DIR
-        if edge_case_dir.exists():
-            for filepath in edge_case_dir.glob("*.json"):
-                self._load_phrase_file(filepath, CATEGORY_EDGE_CASE)
+        for filepath in self._scan_json_files(self.phrases_dir / EDGE_CASE_DIR).values():
+            self._load_phrase_file(filepath, CATEGORY_EDGE_CASE)
         
         # Load specialty files
-        specialty_dir = self.phrases_dir / SPECIALTY_DIR
-        if specialty_dir.exists():
-            for filepath in specialty_dir.glob("*.json"):
-                self._load_phrase_file(filepath, CATEGORY_SPECIALTY)
+        for filepath in self._scan_json_files(self.phrases_dir / SPECIALTY_DIR).values():
+            self._load_phrase_file(filepath, CATEGORY_SPECIALTY)
         
         # Update statistics
         self._update_statistics()
     
+    def _scan_json_files(self, directory: Path) -> Dict[str, Path]:
+        """
+        List the .json files in a directory with a single scandir pass.
+        
+        Replaces per-file exists() checks and glob() with one directory
+        read; a missing directory yields no files.
+        
+        Args:
+            directory: Directory to scan (not recursive)
+        
+        Returns:
+            Dict mapping filename to path, in directory order
+        """
+        files: Dict[str, Path] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    # Same selection as glob("*.json"): no hidden files
+                    if (
+                        name.endswith(".json")
+                        and not name.startswith(".")
+                        and entry.is_file()
+                    ):
+                        files[name] = Path(entry.path)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return files
+    
     def _load_phrase_file(self, filepath: Path, category_type: str) -> None:
         """
         Load a single phrase JSON file.
@@ -328,8 +356,7 @@ class PhraseLoaderManager:
             category_type: Type of category (definite, edge_case, specialty)
         """
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_file(filepath)
             
             # Validate and extract data
             if not self._validate_phrase_schema(data, filepath.name):
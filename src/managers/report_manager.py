@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Report Manager for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-3-3.2-1
-LAST MODIFIED: 2026-01-20
-PHASE: Phase 3 - Analysis & Reporting
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -61,7 +61,6 @@ USAGE:
 """
 
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -72,6 +71,9 @@ from typing import Any, Dict, List, Optional
 import httpx
 from jinja2 import Environment, FileSystemLoader, PackageLoader, select_autoescape
 
+from src.utils.file_utils import DirectoryNameListing
+from src.utils.json_utils import dump_json_file, load_json_file
+
 # Import Phase 3 types
 from .result_analyzer_manager import (
     AnalysisResult,
@@ -83,7 +85,7 @@ from .result_analyzer_manager import (
 )
 
 # Module version
-__version__ = "v5.0-3-3.2-1"
+__version__ = "v5.0-6-6.5-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -104,6 +106,10 @@ JSON_REPORT_PATTERN = "report_{run_id}_{timestamp}.json"
 HTML_REPORT_PATTERN = "report_{run_id}_{timestamp}.html"
 BASELINE_PATTERN = "baseline_{name}.json"
 
+# BASELINE_PATTERN split around {name}, for parsing names back out
+BASELINE_PREFIX = "baseline_"
+BASELINE_SUFFIX = ".json"
+
 # Discord webhook timeout
 DISCORD_TIMEOUT = 30
 
@@ -301,6 +307,11 @@ class ReportManager:
         self._report_dir = Path(self._resolve_report_dir(report_dir))
         self._baseline_dir = Path(self._resolve_baseline_dir(baseline_dir))
         
+        # Baseline names, re-scanned only when the directory's mtime changes
+        self._baseline_listing = DirectoryNameListing(
+            self._baseline_dir, BASELINE_PREFIX, BASELINE_SUFFIX, self._logger
+        )
+        
         # Load regression thresholds
         self._regression_thresholds = self._load_regression_thresholds()
         
@@ -447,8 +458,7 @@ class ReportManager:
         output_path = self._report_dir / filename
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            dump_json_file(report, output_path)
             
             self._logger.info(f"📄 JSON report saved: {output_path}")
             return output_path
@@ -866,8 +876,8 @@ class ReportManager:
         }
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(baseline_data, f, indent=2, ensure_ascii=False)
+            dump_json_file(baseline_data, output_path)
+            self._baseline_listing.invalidate()
             
             self._logger.info(f"💾 Baseline '{name}' saved: {output_path}")
             return output_path
@@ -894,18 +904,16 @@ class ReportManager:
         filename = BASELINE_PATTERN.format(name=name)
         filepath = self._baseline_dir / filename
         
-        if not filepath.exists():
-            self._logger.warning(f"⚠️ Baseline '{name}' not found: {filepath}")
-            return None
-        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json_file(filepath)
             
             analysis = AnalysisResult.from_dict(data["analysis"])
             self._logger.info(f"📂 Baseline '{name}' loaded (run: {analysis.run_id})")
             return analysis
             
+        except FileNotFoundError:
+            self._logger.warning(f"⚠️ Baseline '{name}' not found: {filepath}")
+            return None
         except Exception as e:
             self._logger.error(f"❌ Failed to load baseline '{name}': {e}")
             return None
@@ -914,20 +922,12 @@ class ReportManager:
         """
         List all available baseline names.
         
+        The directory is only re-scanned when its mtime changes.
+        
         Returns:
             List of baseline names
         """
-        baselines = []
-        
-        try:
-            for filepath in self._baseline_dir.glob("baseline_*.json"):
-                # Extract name from filename
-                name = filepath.stem.replace("baseline_", "")
-                baselines.append(name)
-        except Exception as e:
-            self._logger.warning(f"⚠️ Failed to list baselines: {e}")
-        
-        return sorted(baselines)
+        return self._baseline_listing.names()
     
     def compare_to_baseline(
         self,
@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Result Analyzer Manager for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-3-3.1-1
-LAST MODIFIED: 2026-01-20
-PHASE: Phase 3 - Analysis & Reporting
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -54,14 +54,14 @@ USAGE:
 """
 
 import logging
-import statistics
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
 # Module version
-__version__ = "v5.0-3-3.1-1"
+__version__ = "v5.0-6-6.5-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -285,6 +285,7 @@ class AnalysisResult:
         passed_tests: Tests that passed
         failed_tests: Tests that failed (classification mismatch)
         error_tests: Tests with errors (API/connection issues)
+        abort_reason: Why the test run stopped early (None if it completed)
         
         category_metrics: Detailed metrics per category
         subcategory_metrics: Detailed metrics per subcategory
@@ -312,6 +313,7 @@ class AnalysisResult:
     failed_tests: int = 0
     error_tests: int = 0
     skipped_tests: int = 0
+    abort_reason: Optional[str] = None
     
     # Category breakdown
     category_metrics: Dict[str, CategoryMetrics] = field(default_factory=dict)
@@ -389,6 +391,8 @@ class AnalysisResult:
                 "pass_rate": round(self.pass_rate, 4),
                 "error_rate": round(self.error_rate, 2),
                 "tests_per_second": round(self.tests_per_second, 2),
+                "aborted": self.abort_reason is not None,
+                "abort_reason": self.abort_reason,
             },
             
             "false_positive_negative": {
@@ -455,6 +459,7 @@ class AnalysisResult:
         result.failed_tests = summary.get("failed_tests", 0)
         result.error_tests = summary.get("error_tests", 0)
         result.skipped_tests = summary.get("skipped_tests", 0)
+        result.abort_reason = summary.get("abort_reason")
         
         # False positive/negative
         fp_fn = data.get("false_positive_negative", {})
@@ -667,6 +672,7 @@ class ResultAnalyzerManager:
             failed_tests=test_run.failed_tests,
             error_tests=test_run.error_tests,
             skipped_tests=getattr(test_run, 'skipped_tests', 0),
+            abort_reason=getattr(test_run, 'abort_reason', None),
             categories_analyzed=test_run.categories_tested,
             nlp_server_info=test_run.nlp_server_info,
         )
@@ -866,6 +872,21 @@ class ResultAnalyzerManager:
         sorted_times = sorted(response_times)
         count = len(sorted_times)
         
+        # Mean, median and sample standard deviation straight from the
+        # sorted list: min/max/median are index lookups, and mean/variance
+        # use one fsum each instead of the Fraction-based statistics module
+        mean = math.fsum(sorted_times) / count
+        mid = count // 2
+        if count % 2:
+            median = sorted_times[mid]
+        else:
+            median = (sorted_times[mid - 1] + sorted_times[mid]) / 2
+        std_dev = 0.0
+        if count > 1:
+            std_dev = math.sqrt(
+                math.fsum((t - mean) ** 2 for t in sorted_times) / (count - 1)
+            )
+        
         # Calculate percentile indices
         def percentile(data: List[float], p: float) -> float:
             """Calculate percentile value."""
@@ -873,14 +894,14 @@ class ResultAnalyzerManager:
             return data[min(idx, len(data) - 1)]
         
         analysis.latency_metrics = LatencyMetrics(
-            min_ms=min(sorted_times),
-            max_ms=max(sorted_times),
-            mean_ms=statistics.mean(sorted_times),
-            median_ms=statistics.median(sorted_times),
+            min_ms=sorted_times[0],
+            max_ms=sorted_times[-1],
+            mean_ms=mean,
+            median_ms=median,
             p50_ms=percentile(sorted_times, 50),
             p95_ms=percentile(sorted_times, 95),
             p99_ms=percentile(sorted_times, 99),
-            std_dev_ms=statistics.stdev(sorted_times) if count > 1 else 0.0,
+            std_dev_ms=std_dev,
             sample_count=count,
         )
     
@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Snapshot Manager for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-6-6.1-1
-LAST MODIFIED: 2026-02-07
-PHASE: Phase 6 - A/B Testing Infrastructure (v5.1 Migration Phase 1)
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -63,13 +63,18 @@ USAGE:
 
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.json_utils import dump_json_file, load_json_file
 
 # Module version
-__version__ = "v5.0-6-6.1-1"
+__version__ = "v5.0-6-6.5-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -86,6 +91,9 @@ SNAPSHOT_EXTENSION = ".json"
 # Default snapshot storage directory
 DEFAULT_SNAPSHOT_DIR = "/app/reports/snapshots"
 
+# Number of parsed snapshots kept by load_snapshot(), keyed on path + mtime
+SNAPSHOT_CACHE_SIZE = 32
+
 # Current snapshot schema version
 SNAPSHOT_SCHEMA_VERSION = "1.0"
 
@@ -164,6 +172,7 @@ class Snapshot:
     performance: Dict[str, Any] = field(default_factory=dict)
     analysis_result: Optional[Dict[str, Any]] = None
     filepath: str = ""
+    source_mtime_ns: int = 0
 
     @property
     def label(self) -> str:
@@ -250,6 +259,24 @@ class SnapshotManager:
         # Ensure snapshot directory exists
         self._ensure_directory(self._snapshot_dir)
 
+        # Parsed snapshots by resolved path -> (mtime_ns, Snapshot), LRU order.
+        # The API loads snapshots from worker threads, so every access to
+        # the OrderedDict goes through _snapshot_cache_lock (parsing doesn't)
+        self._snapshot_cache: "OrderedDict[str, Tuple[int, Snapshot]]" = OrderedDict()
+        self._snapshot_cache_lock = threading.Lock()
+
+        # Snapshot listing, reused while get_listing_signature() is unchanged.
+        # The generation is bumped on capture/delete since a directory's
+        # mtime can miss changes within its timestamp granularity.
+        self._listing_generation = 0
+        self._listing_cache: Optional[
+            Tuple[Tuple[int, int], List[SnapshotMetadata]]
+        ] = None
+
+        # Per-file listing metadata by path -> (mtime_ns, size, metadata),
+        # so a listing refresh only opens files that are new or changed
+        self._metadata_cache: Dict[str, Tuple[int, int, SnapshotMetadata]] = {}
+
         self._logger.info(
             f"✅ SnapshotManager {__version__} initialized "
             f"(dir: {self._snapshot_dir})"
@@ -296,6 +323,59 @@ class SnapshotManager:
         )
         return f"{SNAPSHOT_PREFIX}_{safe_label}_{timestamp}{SNAPSHOT_EXTENSION}"
 
+    def _iter_snapshot_entries(self) -> Iterator[os.DirEntry]:
+        """
+        Yield directory entries for snapshot files, matched by name.
+
+        Uses os.scandir so the file-type check comes from the directory
+        entry (no stat on most filesystems). A missing snapshot directory
+        yields nothing.
+
+        Yields:
+            os.DirEntry for each snapshot file, in directory order
+        """
+        prefix = f"{SNAPSHOT_PREFIX}_"
+
+        try:
+            with os.scandir(self._snapshot_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (
+                        name.startswith(prefix)
+                        and name.endswith(SNAPSHOT_EXTENSION)
+                        and entry.is_file()
+                    ):
+                        yield entry
+        except FileNotFoundError:
+            return
+
+    def _scan_snapshot_files(self) -> List[Tuple[Path, os.stat_result]]:
+        """
+        Find snapshot files in the snapshot directory in one pass.
+
+        Each matching entry is stat'ed once for its size and mtime; on
+        Linux DirEntry.stat() is a real stat() call, so callers that only
+        need a count should use _count_snapshot_files() instead.
+
+        Returns:
+            List of (path, stat_result) tuples sorted by filename
+        """
+        files = []
+
+        for entry in self._iter_snapshot_entries():
+            try:
+                files.append((Path(entry.path), entry.stat()))
+            except FileNotFoundError:
+                # Deleted between the scan and the stat
+                continue
+
+        files.sort(key=lambda item: item[0].name)
+        return files
+
+    def _count_snapshot_files(self) -> int:
+        """Count snapshot files by name without stat'ing or sorting them."""
+        return sum(1 for _ in self._iter_snapshot_entries())
+
     def capture_snapshot(
         self,
         test_run_summary: Any,
@@ -362,6 +442,9 @@ class SnapshotManager:
                 "total_skipped": getattr(
                     test_run_summary, "skipped_tests", 0
                 ),
+                "abort_reason": getattr(
+                    test_run_summary, "abort_reason", None
+                ),
                 "duration_seconds": test_run_summary.duration_seconds,
                 "categories_tested": test_run_summary.categories_tested,
             },
@@ -390,8 +473,8 @@ class SnapshotManager:
         filepath = self._snapshot_dir / filename
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(snapshot_data, f, indent=2, default=str)
+            dump_json_file(snapshot_data, filepath, default=str)
+            self._listing_generation += 1
 
             file_size = filepath.stat().st_size
             self._logger.info(
@@ -457,6 +540,11 @@ class SnapshotManager:
         """
         Load a snapshot from a JSON file.
 
+        Parsed snapshots are cached (up to SNAPSHOT_CACHE_SIZE) keyed on
+        path and modification time, so repeatedly comparing against the
+        same baseline doesn't re-read it. The returned Snapshot may be
+        shared between callers and should be treated as read-only.
+
         Args:
             filepath: Path to the snapshot JSON file.
                       Can be absolute or relative to snapshot_dir.
@@ -479,13 +567,24 @@ class SnapshotManager:
         if not path.is_absolute():
             path = self._snapshot_dir / path
 
-        if not path.exists():
-            raise FileNotFoundError(f"Snapshot not found: {path}")
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Snapshot not found: {path}") from None
+
+        cache_key = str(path)
+        with self._snapshot_cache_lock:
+            cached = self._snapshot_cache.get(cache_key)
+            hit = cached is not None and cached[0] == mtime_ns
+            if hit:
+                self._snapshot_cache.move_to_end(cache_key)
+        if hit:
+            self._logger.debug(f"📂 Snapshot cache hit: {path.name}")
+            return cached[1]
 
         self._logger.info(f"📂 Loading snapshot: {path.name}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_file(path)
 
         # Validate structure
         is_valid, errors = self._validate_snapshot_data(data)
@@ -503,8 +602,15 @@ class SnapshotManager:
             performance=data.get("performance", {}),
             analysis_result=data.get("analysis_result"),
             filepath=str(path),
+            source_mtime_ns=mtime_ns,
         )
 
+        with self._snapshot_cache_lock:
+            self._snapshot_cache[cache_key] = (mtime_ns, snapshot)
+            self._snapshot_cache.move_to_end(cache_key)
+            while len(self._snapshot_cache) > SNAPSHOT_CACHE_SIZE:
+                self._snapshot_cache.popitem(last=False)
+
         self._logger.info(
             f"✅ Snapshot loaded: {snapshot.label} "
             f"({snapshot.overall_accuracy:.1f}% accuracy, "
@@ -513,12 +619,32 @@ class SnapshotManager:
 
         return snapshot
 
+    def get_listing_signature(self) -> Tuple[int, int]:
+        """
+        Get a token that changes whenever the snapshot listing may have.
+
+        Combines the snapshot directory's mtime (files added or removed,
+        including by other processes) with a counter bumped by this
+        manager's own captures and deletions.
+
+        Returns:
+            Tuple of (directory mtime_ns, listing generation)
+        """
+        try:
+            dir_mtime_ns = self._snapshot_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime_ns = -1
+        return (dir_mtime_ns, self._listing_generation)
+
     def list_snapshots(
         self, sort_by: str = "captured_at", reverse: bool = True
     ) -> List[SnapshotMetadata]:
         """
         List all available snapshots with summary metadata.
 
+        Snapshot files are only re-read when get_listing_signature()
+        changes; otherwise the cached metadata is re-sorted and returned.
+
         Args:
             sort_by: Field to sort by ("captured_at", "label", "accuracy")
             reverse: Sort in descending order if True
@@ -531,21 +657,58 @@ class SnapshotManager:
             >>> for s in snapshots:
             ...     print(f"{s.label}: {s.overall_accuracy:.1f}%")
         """
-        snapshots = []
+        signature = self.get_listing_signature()
+        if self._listing_cache is None or self._listing_cache[0] != signature:
+            self._listing_cache = (signature, self._read_snapshot_metadata())
+            self._logger.info(
+                f"📋 Found {len(self._listing_cache[1])} snapshots"
+            )
+
+        snapshots = list(self._listing_cache[1])
 
-        if not self._snapshot_dir.exists():
-            return snapshots
+        # Sort
+        sort_key_map = {
+            "captured_at": lambda s: s.captured_at,
+            "label": lambda s: s.label,
+            "accuracy": lambda s: s.overall_accuracy,
+        }
+        sort_func = sort_key_map.get(sort_by, sort_key_map["captured_at"])
+        snapshots.sort(key=sort_func, reverse=reverse)
+
+        return snapshots
+
+    def _read_snapshot_metadata(self) -> List[SnapshotMetadata]:
+        """
+        Read summary metadata for every snapshot file on disk.
+
+        Files whose mtime and size match the previous read are served from
+        _metadata_cache without being opened.
+        """
+        snapshots = []
+        previous = self._metadata_cache
+        current: Dict[str, Tuple[int, int, SnapshotMetadata]] = {}
+
+        for path, stat in self._scan_snapshot_files():
+            key = str(path)
+            file_size = stat.st_size
+            cached = previous.get(key)
+            if (
+                cached is not None
+                and cached[0] == stat.st_mtime_ns
+                and cached[1] == file_size
+            ):
+                current[key] = cached
+                snapshots.append(cached[2])
+                continue
 
-        for path in sorted(self._snapshot_dir.glob(f"{SNAPSHOT_PREFIX}_*{SNAPSHOT_EXTENSION}")):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = load_json_file(path)
 
                 metadata = data.get("_metadata", {})
                 summary = data.get("results_summary", {})
 
-                snapshots.append(SnapshotMetadata(
-                    filepath=str(path),
+                entry = SnapshotMetadata(
+                    filepath=key,
                     filename=path.name,
                     label=metadata.get("label", "unknown"),
                     description=metadata.get("description", ""),
@@ -560,8 +723,8 @@ class SnapshotManager:
                     ),
                     total_passed=summary.get("total_passed", 0),
                     total_failed=summary.get("total_failed", 0),
-                    file_size_bytes=path.stat().st_size,
-                ))
+                    file_size_bytes=file_size,
+                )
 
             except (json.JSONDecodeError, OSError) as e:
                 self._logger.warning(
@@ -569,16 +732,11 @@ class SnapshotManager:
                 )
                 continue
 
-        # Sort
-        sort_key_map = {
-            "captured_at": lambda s: s.captured_at,
-            "label": lambda s: s.label,
-            "accuracy": lambda s: s.overall_accuracy,
-        }
-        sort_func = sort_key_map.get(sort_by, sort_key_map["captured_at"])
-        snapshots.sort(key=sort_func, reverse=reverse)
+            current[key] = (stat.st_mtime_ns, file_size, entry)
+            snapshots.append(entry)
 
-        self._logger.info(f"📋 Found {len(snapshots)} snapshots")
+        # Dropping the old dict also forgets files that were removed
+        self._metadata_cache = current
         return snapshots
 
     def validate_snapshot(self, filepath: str) -> Tuple[bool, List[str]]:
@@ -603,14 +761,11 @@ class SnapshotManager:
 
         errors = []
 
-        # Check file exists
-        if not path.exists():
-            return False, [f"File not found: {path}"]
-
-        # Check file is readable JSON
+        # Check file exists and is readable JSON
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json_file(path)
+        except FileNotFoundError:
+            return False, [f"File not found: {path}"]
         except json.JSONDecodeError as e:
             return False, [f"Invalid JSON: {e}"]
         except OSError as e:
@@ -677,16 +832,18 @@ class SnapshotManager:
         if not path.is_absolute():
             path = self._snapshot_dir / path
 
-        if not path.exists():
-            self._logger.warning(
-                f"⚠️ Snapshot not found for deletion: {path}"
-            )
-            return False
-
         try:
             path.unlink()
+            with self._snapshot_cache_lock:
+                self._snapshot_cache.pop(str(path), None)
+            self._listing_generation += 1
             self._logger.info(f"🗑️ Deleted snapshot: {path.name}")
             return True
+        except FileNotFoundError:
+            self._logger.warning(
+                f"⚠️ Snapshot not found for deletion: {path}"
+            )
+            return False
         except OSError as e:
             self._logger.error(
                 f"❌ Failed to delete snapshot {path.name}: {e}"
@@ -699,11 +856,7 @@ class SnapshotManager:
 
     def get_status(self) -> Dict[str, Any]:
         """Get snapshot manager status information."""
-        snapshot_count = len(list(
-            self._snapshot_dir.glob(
-                f"{SNAPSHOT_PREFIX}_*{SNAPSHOT_EXTENSION}"
-            )
-        )) if self._snapshot_dir.exists() else 0
+        snapshot_count = self._count_snapshot_files()
 
         return {
             "version": __version__,
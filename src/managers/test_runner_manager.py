@@ -13,9 +13,9 @@ MISSION - NEVER TO BE VIOLATED:
 ============================================================================
 Test Runner Manager for Ash-Thrash Service
 ----------------------------------------------------------------------------
-FILE VERSION: v5.0-2-2.3-1
-LAST MODIFIED: 2026-01-20
-PHASE: Phase 2 - Test Execution Engine
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
 CLEAN ARCHITECTURE: Compliant
 Repository: https://github.com/the-alphabet-cartel/ash-thrash
 ============================================================================
@@ -27,14 +27,14 @@ RESPONSIBILITIES:
 - Integrate with validators for classification and response validation
 - Track progress and provide real-time status updates
 - Capture timing for performance analysis
-- Handle errors gracefully (continue on failures)
+- Handle errors gracefully (continue on failures, abort if Ash-NLP goes away)
 - Support category filtering and single phrase testing
 
 EXECUTION FLOW:
     1. Load phrases from PhraseLoaderManager
     2. Filter by category (if specified)
-    3. For each phrase:
-       a. Call NLPClientManager.analyze()
+    3. For each phrase (up to max_concurrent_tests in flight):
+       a. Call NLPClientManager.analyze() (or analyze_batch() per batch_size chunk)
        b. Validate response with ResponseValidator
        c. Validate classification with ClassificationValidator
        d. Record result with timing
@@ -73,10 +73,12 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .nlp_client_manager import NLPConnectionError, NLPResponseError, NLPTimeoutError
 
 # Module version
-__version__ = "v5.0-2-2.3-1"
+__version__ = "v5.0-6-6.5-1"
 
 # Initialize logger
 logger = logging.getLogger(__name__)
@@ -89,8 +91,17 @@ logger = logging.getLogger(__name__)
 # Default delay between tests (milliseconds)
 DEFAULT_TEST_DELAY_MS = 100
 
-# Maximum concurrent tests (for future parallel execution)
-MAX_CONCURRENT_TESTS = 1  # Sequential for now
+# Default number of tests allowed in flight at once (1 = sequential)
+MAX_CONCURRENT_TESTS = 1
+
+# Default phrases per /analyze/batch request (0 or 1 = one /analyze per phrase)
+DEFAULT_BATCH_SIZE = 0
+
+# Abort a run after this many consecutive connection/timeout errors (0 = never)
+DEFAULT_MAX_CONSECUTIVE_ERRORS = 10
+
+# Error types that indicate Ash-NLP is unreachable rather than misbehaving
+UNREACHABLE_ERROR_TYPES = {"timeout", "connection_error"}
 
 
 # =============================================================================
@@ -214,6 +225,7 @@ class TestRunSummary:
         results: List of individual test results
         categories_tested: List of categories included in run
         nlp_server_info: Information about Ash-NLP server
+        abort_reason: Why the run stopped early (None if it ran to completion)
     """
     run_id: str
     start_time: datetime
@@ -231,6 +243,12 @@ class TestRunSummary:
     results: List[TestResult] = field(default_factory=list)
     categories_tested: List[str] = field(default_factory=list)
     nlp_server_info: Optional[Dict[str, Any]] = None
+    abort_reason: Optional[str] = None
+    
+    @property
+    def aborted(self) -> bool:
+        """Whether the run was stopped before every phrase was sent."""
+        return self.abort_reason is not None
     
     @property
     def duration_seconds(self) -> float:
@@ -265,6 +283,8 @@ class TestRunSummary:
             "categories_tested": self.categories_tested,
             "nlp_server_info": self.nlp_server_info,
             "tests_per_second": self.tests_per_second,
+            "aborted": self.aborted,
+            "abort_reason": self.abort_reason,
         }
 
 
@@ -294,6 +314,9 @@ class TestRunnerManager:
         classification_validator: ClassificationValidator for priority matching
         response_validator: ResponseValidator for API response validation
         test_delay_ms: Delay between tests (milliseconds)
+        max_concurrent_tests: Maximum number of tests in flight at once
+        batch_size: Phrases per /analyze/batch request (<= 1 disables batching)
+        max_consecutive_errors: Abort after this many consecutive unreachable errors
     
     Example:
         >>> runner = create_test_runner_manager(
@@ -318,6 +341,9 @@ class TestRunnerManager:
         config_manager: Optional[Any] = None,
         logging_manager: Optional[Any] = None,
         test_delay_ms: int = DEFAULT_TEST_DELAY_MS,
+        max_concurrent_tests: int = MAX_CONCURRENT_TESTS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_consecutive_errors: int = DEFAULT_MAX_CONSECUTIVE_ERRORS,
     ):
         """
         Initialize the TestRunnerManager.
@@ -330,6 +356,10 @@ class TestRunnerManager:
             config_manager: Optional ConfigManager
             logging_manager: Optional LoggingConfigManager
             test_delay_ms: Delay between tests in milliseconds
+            max_concurrent_tests: Maximum number of tests in flight at once
+            batch_size: Phrases per /analyze/batch request (<= 1 disables batching)
+            max_consecutive_errors: Abort after this many consecutive
+                connection/timeout errors (0 disables early abort)
         
         Note:
             Use create_test_runner_manager() factory function instead.
@@ -340,6 +370,9 @@ class TestRunnerManager:
         self._classification_validator = classification_validator
         self._response_validator = response_validator
         self._test_delay_ms = test_delay_ms
+        self._max_concurrent_tests = max(1, int(max_concurrent_tests))
+        self._batch_size = max(0, int(batch_size))
+        self._max_consecutive_errors = max(0, int(max_consecutive_errors))
         
         # Set up logger
         if logging_manager:
@@ -350,9 +383,15 @@ class TestRunnerManager:
         # Statistics
         self._current_run: Optional[TestRunSummary] = None
         
+        # Per-run memo of Ash-NLP calls keyed by (message, include_explanation).
+        # Only active inside run_all_tests so ad-hoc tests always hit the API.
+        self._response_cache: Optional[Dict[Tuple[str, bool], asyncio.Future]] = None
+        self._response_cache_hits = 0
+        
         self._logger.info(
             f"✅ TestRunnerManager {__version__} initialized "
-            f"(delay: {test_delay_ms}ms)"
+            f"(delay: {test_delay_ms}ms, concurrency: {self._max_concurrent_tests}, "
+            f"batch_size: {self._batch_size})"
         )
     
     async def run_all_tests(
@@ -433,51 +472,151 @@ class TestRunnerManager:
             summary.end_time = datetime.now()
             return summary
         
-        # Run tests
+        # Run tests with at most max_concurrent_tests requests in flight.
+        # A request is a single /analyze call, or one /analyze/batch call
+        # covering batch_size phrases when batching is enabled. Each slot
+        # waits test_delay_ms after its request so the per-slot pacing
+        # toward Ash-NLP matches the sequential behaviour.
         response_times: List[float] = []
+        self._response_cache = {}
+        self._response_cache_hits = 0
+        semaphore = asyncio.Semaphore(self._max_concurrent_tests)
+        batching = self._batch_size > 1
+        # Phrases per task: one per task when batching is off (0 or 1)
+        chunk_size = self._batch_size if batching else 1
         
-        for idx, phrase in enumerate(phrases, 1):
-            # Generate unique phrase ID
-            phrase_id = f"{phrase.category}_{phrase.subcategory}_{idx}"
-            
-            # Execute single test
-            result = await self._run_single_test(
-                phrase=phrase,
-                phrase_id=phrase_id,
-                include_explanation=include_explanation,
-            )
-            
-            # Record result
-            summary.results.append(result)
-            
-            # Update counters
-            if result.status == TestStatus.PASSED:
-                summary.passed_tests += 1
-            elif result.status == TestStatus.FAILED:
-                summary.failed_tests += 1
-            elif result.status == TestStatus.ERROR:
-                summary.error_tests += 1
-            else:
-                summary.skipped_tests += 1
-            
-            # Track response time (only for successful API calls)
-            if result.response_time_ms > 0:
-                response_times.append(result.response_time_ms)
+        async def run_bounded(start_idx: int, chunk: List[Any]) -> List[tuple]:
+            indices = range(start_idx, start_idx + len(chunk))
+            phrase_ids = [
+                f"{phrase.category}_{phrase.subcategory}_{idx}"
+                for idx, phrase in zip(indices, chunk)
+            ]
+            async with semaphore:
+                if batching:
+                    results = await self._run_batch_test(
+                        phrases=chunk,
+                        phrase_ids=phrase_ids,
+                        include_explanation=include_explanation,
+                    )
+                else:
+                    results = [await self._run_single_test(
+                        phrase=chunk[0],
+                        phrase_id=phrase_ids[0],
+                        include_explanation=include_explanation,
+                    )]
+                if self._test_delay_ms > 0 and indices[-1] < summary.total_tests:
+                    await asyncio.sleep(self._test_delay_ms / 1000)
+            return list(zip(indices, results))
+        
+        tasks = [
+            asyncio.create_task(run_bounded(start + 1, phrases[start:start + chunk_size]))
+            for start in range(0, summary.total_tests, chunk_size)
+        ]
+        ordered_results: List[Optional[TestResult]] = [None] * summary.total_tests
+        completed = 0
+        consecutive_errors = 0
+        aborted = False
+        
+        async def report_progress(result: TestResult) -> None:
+            """Record a result and pass it to the progress callback."""
+            nonlocal completed
+            completed += 1
+            self._record_result(summary, result, response_times)
             
             # Call progress callback
             if progress_callback:
                 try:
                     # Support both sync and async callbacks
                     if asyncio.iscoroutinefunction(progress_callback):
-                        await progress_callback(idx, summary.total_tests, result)
+                        await progress_callback(completed, summary.total_tests, result)
                     else:
-                        progress_callback(idx, summary.total_tests, result)
+                        progress_callback(completed, summary.total_tests, result)
                 except Exception as e:
                     self._logger.warning(f"Progress callback error: {e}")
+        
+        for next_chunk in asyncio.as_completed(tasks):
+            for idx, result in await next_chunk:
+                # Track consecutive unreachable errors for early abort
+                if (
+                    result.status == TestStatus.ERROR
+                    and result.error_type is not None
+                    and result.error_type.value in UNREACHABLE_ERROR_TYPES
+                ):
+                    consecutive_errors += 1
+                else:
+                    consecutive_errors = 0
+                if (
+                    self._max_consecutive_errors
+                    and consecutive_errors >= self._max_consecutive_errors
+                ):
+                    aborted = True
+                
+                ordered_results[idx - 1] = result
+                await report_progress(result)
             
-            # Delay between tests
-            if self._test_delay_ms > 0 and idx < summary.total_tests:
-                await asyncio.sleep(self._test_delay_ms / 1000)
+            if aborted:
+                break
+        
+        if aborted:
+            summary.abort_reason = (
+                f"Ash-NLP unreachable: {consecutive_errors} consecutive "
+                f"connection/timeout errors"
+            )
+            self._logger.error(
+                f"❌ Aborting run after {consecutive_errors} consecutive "
+                f"connection/timeout errors - Ash-NLP appears to be unreachable"
+            )
+            for task in tasks:
+                task.cancel()
+            
+            # Keep any chunks that finished before cancellation took effect
+            for finished in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(finished, BaseException):
+                    continue
+                for idx, result in finished:
+                    if ordered_results[idx - 1] is None:
+                        ordered_results[idx - 1] = result
+                        await report_progress(result)
+            
+            # Remaining phrases were never sent
+            for idx, phrase in enumerate(phrases, 1):
+                if ordered_results[idx - 1] is None:
+                    skipped = TestResult(
+                        phrase_id=f"{phrase.category}_{phrase.subcategory}_{idx}",
+                        category=phrase.category,
+                        subcategory=phrase.subcategory,
+                        message=phrase.message,
+                        expected_priorities=phrase.expected_priorities,
+                        actual_severity=None,
+                        crisis_score=None,
+                        confidence=None,
+                        status=TestStatus.SKIPPED,
+                        failure_reason="Run aborted: Ash-NLP unreachable",
+                        timestamp=datetime.now(),
+                    )
+                    ordered_results[idx - 1] = skipped
+                    await report_progress(skipped)
+        
+        # Results arrive in completion order; restore phrase order
+        summary.results = ordered_results
+        
+        if self._response_cache_hits:
+            self._logger.debug(
+                f"♻️ Reused {self._response_cache_hits} Ash-NLP responses "
+                f"for duplicate messages"
+            )
+
+        # Cancelling the test tasks doesn't reach the shielded Ash-NLP calls;
+        # stop any still in flight (after an abort) and collect their results
+        pending = [
+            future for future in self._response_cache.values()
+            if not future.done()
+        ]
+        for future in pending:
+            future.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._response_cache = None
         
         # Finalize summary
         summary.end_time = datetime.now()
@@ -499,6 +638,29 @@ class TestRunnerManager:
         
         return summary
     
+    def _record_result(
+        self,
+        summary: TestRunSummary,
+        result: TestResult,
+        response_times: List[float],
+    ) -> None:
+        """Append a result to the run summary and update its counters."""
+        summary.results.append(result)
+        
+        # Update counters
+        if result.status == TestStatus.PASSED:
+            summary.passed_tests += 1
+        elif result.status == TestStatus.FAILED:
+            summary.failed_tests += 1
+        elif result.status == TestStatus.ERROR:
+            summary.error_tests += 1
+        else:
+            summary.skipped_tests += 1
+        
+        # Track response time (only for successful API calls)
+        if result.response_time_ms > 0:
+            response_times.append(result.response_time_ms)
+    
     async def _run_single_test(
         self,
         phrase: Any,  # TestPhrase
@@ -533,54 +695,22 @@ class TestRunnerManager:
         )
         
         try:
-            # Call Ash-NLP API
-            response = await self._nlp_client.analyze(
+            # Call Ash-NLP API (or reuse the call for an identical message)
+            response, result.response_time_ms = await self._analyze_memoized(
                 message=phrase.message,
                 include_explanation=include_explanation,
             )
             
-            # Calculate response time
-            result.response_time_ms = (time.perf_counter() - start_time) * 1000
-            
-            # Store raw response
-            result.full_response = response.raw_response
-            result.actual_severity = response.severity
-            result.crisis_score = response.crisis_score
-            result.confidence = response.confidence
-            
-            # Validate response structure
-            resp_validation = self._response_validator.validate(response.raw_response)
-            if not resp_validation.is_valid:
-                result.status = TestStatus.ERROR
-                result.error_type = ErrorType.INVALID_RESPONSE
-                result.failure_reason = f"Invalid response: {resp_validation.errors[0]}"
-                result.validation_details = resp_validation.to_dict()
-                return result
-            
-            # Validate classification
-            class_validation = self._classification_validator.validate(
-                actual_severity=response.severity,
-                **phrase.get_validation_params()
-            )
-            
-            result.validation_details = class_validation.to_dict()
+            self._apply_validation(result, phrase, response)
             
-            if class_validation.passed:
-                result.status = TestStatus.PASSED
-                result.failure_reason = None
-            else:
-                result.status = TestStatus.FAILED
-                result.error_type = ErrorType.CLASSIFICATION_FAIL
-                result.failure_reason = class_validation.failure_reason
-            
-        except asyncio.TimeoutError:
+        except (asyncio.TimeoutError, NLPTimeoutError):
             result.response_time_ms = (time.perf_counter() - start_time) * 1000
             result.status = TestStatus.ERROR
             result.error_type = ErrorType.TIMEOUT
             result.failure_reason = "API request timed out"
             self._logger.warning(f"⏱️ Timeout for phrase: {phrase.message[:50]}...")
             
-        except ConnectionError as e:
+        except (ConnectionError, NLPConnectionError) as e:
             result.response_time_ms = (time.perf_counter() - start_time) * 1000
             result.status = TestStatus.ERROR
             result.error_type = ErrorType.CONNECTION_ERROR
@@ -596,6 +726,234 @@ class TestRunnerManager:
         
         return result
     
+    async def _timed_analyze(
+        self,
+        message: str,
+        include_explanation: bool,
+    ) -> Tuple[Any, float]:
+        """Call Ash-NLP /analyze and return (response, response_time_ms)."""
+        start_time = time.perf_counter()
+        response = await self._nlp_client.analyze(
+            message=message,
+            include_explanation=include_explanation,
+        )
+        return response, (time.perf_counter() - start_time) * 1000
+    
+    async def _analyze_memoized(
+        self,
+        message: str,
+        include_explanation: bool,
+    ) -> Tuple[Any, float]:
+        """
+        Analyze a message, sharing one API call between duplicate messages.
+        
+        Phrase files can repeat the same message under different categories.
+        During a run the first call for a message is stored as a future, and
+        later (or concurrent) tests for the same text await it instead of
+        calling Ash-NLP again. The original response time is reported for
+        every reuse so latency statistics are not skewed. Failed calls are
+        evicted so a duplicate gets its own attempt.
+        
+        Args:
+            message: Message text to analyze
+            include_explanation: Whether to request explanation
+        
+        Returns:
+            Tuple of (AnalyzeResponse, response_time_ms)
+        """
+        if self._response_cache is None:
+            return await self._timed_analyze(message, include_explanation)
+        
+        key = (message, include_explanation)
+        future = self._response_cache.get(key)
+        
+        if future is None:
+            future = asyncio.ensure_future(
+                self._timed_analyze(message, include_explanation)
+            )
+            self._response_cache[key] = future
+        else:
+            self._response_cache_hits += 1
+        
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            if self._response_cache is not None and self._response_cache.get(key) is future:
+                del self._response_cache[key]
+            raise
+    
+    def _apply_validation(
+        self,
+        result: TestResult,
+        phrase: Any,  # TestPhrase
+        response: Any,  # AnalyzeResponse
+    ) -> None:
+        """
+        Record an Ash-NLP response on a result and validate it.
+        
+        Args:
+            result: TestResult to update in place
+            phrase: TestPhrase the response belongs to
+            response: AnalyzeResponse returned by Ash-NLP
+        """
+        # Store raw response
+        result.full_response = response.raw_response
+        result.actual_severity = response.severity
+        result.crisis_score = response.crisis_score
+        result.confidence = response.confidence
+        
+        # Validate response structure
+        resp_validation = self._response_validator.validate(response.raw_response)
+        if not resp_validation.is_valid:
+            result.status = TestStatus.ERROR
+            result.error_type = ErrorType.INVALID_RESPONSE
+            result.failure_reason = f"Invalid response: {resp_validation.errors[0]}"
+            result.validation_details = resp_validation.to_dict()
+            return
+        
+        # Validate classification
+        class_validation = self._classification_validator.validate(
+            actual_severity=response.severity,
+            **phrase.get_validation_params()
+        )
+        
+        result.validation_details = class_validation.to_dict()
+        
+        if class_validation.passed:
+            result.status = TestStatus.PASSED
+            result.failure_reason = None
+        else:
+            result.status = TestStatus.FAILED
+            result.error_type = ErrorType.CLASSIFICATION_FAIL
+            result.failure_reason = class_validation.failure_reason
+    
+    async def _run_batch_test(
+        self,
+        phrases: List[Any],  # List[TestPhrase]
+        phrase_ids: List[str],
+        include_explanation: bool = False,
+    ) -> List[TestResult]:
+        """
+        Execute several test phrases through one /analyze/batch request.
+        
+        The batch round-trip time is split evenly across its phrases. If
+        Ash-NLP rejects the batch or returns the wrong number of results,
+        each phrase is retried individually so one bad batch does not error
+        every test in it. Connection failures and timeouts are not retried
+        per phrase (the client has already retried the batch); every phrase
+        gets the error straight away so the early-abort counter sees it.
+        
+        Args:
+            phrases: TestPhrase objects to test
+            phrase_ids: Unique identifier for each phrase, in the same order
+            include_explanation: Whether to request explanations
+        
+        Returns:
+            TestResults in the same order as phrases
+        """
+        start_time = time.perf_counter()
+        
+        try:
+            responses = await self._nlp_client.analyze_batch(
+                messages=[phrase.message for phrase in phrases],
+                include_explanation=include_explanation,
+            )
+            if len(responses) != len(phrases):
+                raise ValueError(
+                    f"expected {len(phrases)} results, got {len(responses)}"
+                )
+        except (NLPResponseError, ValueError) as e:
+            self._logger.warning(
+                f"⚠️ Batch request failed ({e}), falling back to per-phrase requests"
+            )
+            return [
+                await self._run_single_test(
+                    phrase=phrase,
+                    phrase_id=phrase_id,
+                    include_explanation=include_explanation,
+                )
+                for phrase, phrase_id in zip(phrases, phrase_ids)
+            ]
+        except (asyncio.TimeoutError, NLPTimeoutError):
+            self._logger.warning(
+                f"⏱️ Timeout for batch of {len(phrases)} phrases"
+            )
+            return self._batch_error_results(
+                phrases, phrase_ids, start_time,
+                ErrorType.TIMEOUT, "API request timed out",
+            )
+        except (ConnectionError, NLPConnectionError) as e:
+            self._logger.warning(f"🔌 Connection error: {e}")
+            return self._batch_error_results(
+                phrases, phrase_ids, start_time,
+                ErrorType.CONNECTION_ERROR, f"Connection error: {str(e)}",
+            )
+        except Exception as e:
+            self._logger.error(f"❌ Unexpected error testing batch: {e}")
+            return self._batch_error_results(
+                phrases, phrase_ids, start_time,
+                ErrorType.UNKNOWN, f"Unexpected error: {str(e)}",
+            )
+        
+        per_phrase_ms = (time.perf_counter() - start_time) * 1000 / len(phrases)
+        results = []
+        
+        for phrase, phrase_id, response in zip(phrases, phrase_ids, responses):
+            result = self._new_result(phrase, phrase_id, per_phrase_ms)
+            
+            try:
+                self._apply_validation(result, phrase, response)
+            except Exception as e:
+                result.status = TestStatus.ERROR
+                result.error_type = ErrorType.UNKNOWN
+                result.failure_reason = f"Unexpected error: {str(e)}"
+                self._logger.error(f"❌ Unexpected error validating phrase: {e}")
+            
+            results.append(result)
+        
+        return results
+    
+    def _new_result(
+        self,
+        phrase: Any,  # TestPhrase
+        phrase_id: str,
+        response_time_ms: float,
+    ) -> TestResult:
+        """Create a TestResult for a phrase, in ERROR state until validated."""
+        return TestResult(
+            phrase_id=phrase_id,
+            category=phrase.category,
+            subcategory=phrase.subcategory,
+            message=phrase.message,
+            expected_priorities=phrase.expected_priorities,
+            actual_severity=None,
+            crisis_score=None,
+            confidence=None,
+            status=TestStatus.ERROR,
+            timestamp=datetime.now(),
+            response_time_ms=response_time_ms,
+        )
+    
+    def _batch_error_results(
+        self,
+        phrases: List[Any],  # List[TestPhrase]
+        phrase_ids: List[str],
+        start_time: float,
+        error_type: ErrorType,
+        failure_reason: str,
+    ) -> List[TestResult]:
+        """Give every phrase in a failed batch the same error result."""
+        per_phrase_ms = (time.perf_counter() - start_time) * 1000 / len(phrases)
+        results = []
+        
+        for phrase, phrase_id in zip(phrases, phrase_ids):
+            result = self._new_result(phrase, phrase_id, per_phrase_ms)
+            result.error_type = error_type
+            result.failure_reason = failure_reason
+            results.append(result)
+        
+        return results
+    
     def _calculate_accuracy_metrics(self, summary: TestRunSummary) -> None:
         """Calculate accuracy metrics for the summary."""
         # Overall accuracy (excluding errors)
@@ -705,6 +1063,9 @@ class TestRunnerManager:
         return {
             "version": __version__,
             "test_delay_ms": self._test_delay_ms,
+            "max_concurrent_tests": self._max_concurrent_tests,
+            "batch_size": self._batch_size,
+            "max_consecutive_errors": self._max_consecutive_errors,
             "phrases_loaded": len(self._phrase_loader),
             "categories_available": self._phrase_loader.get_all_categories(),
             "has_current_run": self._current_run is not None,
@@ -723,6 +1084,9 @@ def create_test_runner_manager(
     config_manager: Optional[Any] = None,
     logging_manager: Optional[Any] = None,
     test_delay_ms: Optional[int] = None,
+    max_concurrent_tests: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    max_consecutive_errors: Optional[int] = None,
 ) -> TestRunnerManager:
     """
     Factory function for TestRunnerManager (Clean Architecture v5.2.1 Pattern).
@@ -738,6 +1102,9 @@ def create_test_runner_manager(
         config_manager: Optional ConfigManager for settings
         logging_manager: Optional LoggingConfigManager for custom logger
         test_delay_ms: Override delay between tests (milliseconds)
+        max_concurrent_tests: Override maximum number of tests in flight
+        batch_size: Override phrases per /analyze/batch request
+        max_consecutive_errors: Override early-abort error threshold
     
     Returns:
         Configured TestRunnerManager instance
@@ -768,8 +1135,32 @@ def create_test_runner_manager(
         if test_delay_ms is None:
             test_delay_ms = DEFAULT_TEST_DELAY_MS
     
+    # Resolve concurrency
+    if max_concurrent_tests is None:
+        if config_manager:
+            max_concurrent_tests = config_manager.get("test_execution", "max_concurrent_tests")
+        if max_concurrent_tests is None:
+            max_concurrent_tests = MAX_CONCURRENT_TESTS
+    
+    # Resolve batch size
+    if batch_size is None:
+        if config_manager:
+            batch_size = config_manager.get("test_execution", "batch_size")
+        if batch_size is None:
+            batch_size = DEFAULT_BATCH_SIZE
+    
+    # Resolve early-abort threshold
+    if max_consecutive_errors is None:
+        if config_manager:
+            max_consecutive_errors = config_manager.get(
+                "test_execution", "max_consecutive_errors"
+            )
+        if max_consecutive_errors is None:
+            max_consecutive_errors = DEFAULT_MAX_CONSECUTIVE_ERRORS
+    
     logger.debug(
-        f"🏭 Creating TestRunnerManager (delay: {test_delay_ms}ms)"
+        f"🏭 Creating TestRunnerManager (delay: {test_delay_ms}ms, "
+        f"concurrency: {max_concurrent_tests}, batch_size: {batch_size})"
     )
     
     return TestRunnerManager(
@@ -780,6 +1171,9 @@ def create_test_runner_manager(
         config_manager=config_manager,
         logging_manager=logging_manager,
         test_delay_ms=test_delay_ms,
+        max_concurrent_tests=max_concurrent_tests,
+        batch_size=batch_size,
+        max_consecutive_errors=max_consecutive_errors,
     )
 
 
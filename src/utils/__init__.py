@@ -0,0 +1,58 @@
+"""
+============================================================================
+Ash-Thrash: Discord Crisis Detection Testing Suite
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Validate  → Verify crisis detection accuracy through live Ash-NLP integration testing
+    Challenge → Stress test the system with edge cases and adversarial scenarios
+    Guard     → Prevent regressions that could compromise detection reliability
+    Protect   → Safeguard our LGBTQIA+ community through rigorous quality assurance
+
+============================================================================
+Ash-Thrash Utilities Package
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-thrash
+============================================================================
+
+This package contains small shared helpers used across managers and
+evaluators:
+
+- file_utils: Prefix/suffix directory listings cached on directory mtime
+- json_utils: JSON file reading/writing and response serialization with
+  optional orjson acceleration
+- time_utils: Second-resolution timestamp formatting cached per second
+
+USAGE:
+    from src.utils import dump_json_file
+    
+    dump_json_file(report, output_path)
+"""
+
+__version__ = "5.0.0"
+__author__ = "The Alphabet Cartel"
+__email__ = "dev@alphabetcartel.org"
+__url__ = "https://github.com/the-alphabet-cartel/ash-thrash"
+
+from src.utils.file_utils import DirectoryNameListing
+from src.utils.json_utils import (
+    dump_json_file,
+    dumps_json,
+    load_json_file,
+    ORJSON_AVAILABLE,
+)
+from src.utils.time_utils import CachedTimeFormatter
+
+__all__ = [
+    "CachedTimeFormatter",
+    "DirectoryNameListing",
+    "dump_json_file",
+    "dumps_json",
+    "load_json_file",
+    "ORJSON_AVAILABLE",
+]
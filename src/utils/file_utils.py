@@ -0,0 +1,136 @@
+"""
+============================================================================
+Ash-Thrash: Discord Crisis Detection Testing Suite
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Validate  → Verify crisis detection accuracy through live Ash-NLP integration testing
+    Challenge → Stress test the system with edge cases and adversarial scenarios
+    Guard     → Prevent regressions that could compromise detection reliability
+    Protect   → Safeguard our LGBTQIA+ community through rigorous quality assurance
+
+============================================================================
+File Utilities for Ash-Thrash Service
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-thrash
+============================================================================
+
+RESPONSIBILITIES:
+- List "<prefix><name><suffix>" files in a directory with one scandir pass
+- Cache the listing until the directory's mtime changes
+
+USAGE:
+    from src.utils.file_utils import DirectoryNameListing
+
+    listing = DirectoryNameListing(baseline_dir, "baseline_", ".json")
+    names = listing.names()
+    listing.invalidate()  # after writing a new file
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+# Module version
+__version__ = "v5.0-6-6.5-1"
+
+# Initialize logger
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Directory Listing
+# =============================================================================
+
+class DirectoryNameListing:
+    """
+    Names of files matching a prefix/suffix in one directory.
+
+    The directory is only re-scanned when its mtime changes, so repeated
+    listings of an unchanged directory cost a single stat().
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        prefix: str,
+        suffix: str,
+        logger_instance: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize the listing.
+
+        Args:
+            directory: Directory to scan
+            prefix: Filename prefix to match and strip
+            suffix: Filename suffix to match and strip
+            logger_instance: Logger for scan failures (module logger if None)
+        """
+        self._directory = Path(directory)
+        self._prefix = prefix
+        self._suffix = suffix
+        self._logger = logger_instance or logger
+
+        # (directory mtime_ns, sorted names) from the last scan
+        self._cached: Optional[Tuple[int, List[str]]] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached listing so the next call re-scans."""
+        self._cached = None
+
+    def names(self) -> List[str]:
+        """
+        List matching names with the prefix and suffix stripped.
+
+        Returns:
+            Sorted list of names (empty if the directory does not exist)
+        """
+        try:
+            dir_mtime_ns: Optional[int] = self._directory.stat().st_mtime_ns
+        except OSError:
+            dir_mtime_ns = None
+
+        cached = self._cached
+        if cached is not None and cached[0] == dir_mtime_ns:
+            return list(cached[1])
+
+        names = []
+        prefix_len = len(self._prefix)
+        suffix_len = len(self._suffix)
+
+        try:
+            # One scandir pass instead of glob's listdir + fnmatch per entry
+            with os.scandir(self._directory) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if (
+                        filename.startswith(self._prefix)
+                        and filename.endswith(self._suffix)
+                        and entry.is_file()
+                    ):
+                        names.append(filename[prefix_len:len(filename) - suffix_len])
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self._logger.warning(f"⚠️ Failed to list {self._directory}: {e}")
+            return sorted(names)
+
+        names.sort()
+        if dir_mtime_ns is not None:
+            self._cached = (dir_mtime_ns, names)
+        return list(names)
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "DirectoryNameListing",
+]
@@ -0,0 +1,182 @@
+"""
+============================================================================
+Ash-Thrash: Discord Crisis Detection Testing Suite
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Validate  → Verify crisis detection accuracy through live Ash-NLP integration testing
+    Challenge → Stress test the system with edge cases and adversarial scenarios
+    Guard     → Prevent regressions that could compromise detection reliability
+    Protect   → Safeguard our LGBTQIA+ community through rigorous quality assurance
+
+============================================================================
+JSON Utilities for Ash-Thrash Service
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-thrash
+============================================================================
+
+RESPONSIBILITIES:
+- Write report, baseline and snapshot JSON files
+- Read snapshot, baseline and phrase JSON files
+- Serialize compact JSON bytes for API responses
+- Use orjson (C implementation) when installed, stdlib json otherwise
+- Keep on-disk output identical in shape between the two backends
+  (except non-finite floats: orjson writes NaN/Infinity as null)
+
+USAGE:
+    from src.utils.json_utils import dump_json_file, load_json_file
+    
+    dump_json_file(report, output_path)
+    dump_json_file(snapshot_data, filepath, default=str)
+    data = load_json_file(filepath)
+    body = dumps_json({"status": "ok"})
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+# Optional fast JSON backend
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Module version
+__version__ = "v5.0-6-6.5-1"
+
+
+# =============================================================================
+# Constants
+# =============================================================================
+
+# orjson options matching json.dump(indent=2, ensure_ascii=False):
+# - datetimes are passed to `default` so default=str keeps the stdlib format
+# - non-string dict keys are stringified like the stdlib does
+ORJSON_DUMP_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if ORJSON_AVAILABLE else 0
+)
+
+
+# =============================================================================
+# Writing
+# =============================================================================
+
+def dump_json_file(
+    data: Any,
+    path: Union[str, Path],
+    default: Optional[Callable[[Any], Any]] = None,
+) -> None:
+    """
+    Write data to a JSON file with 2-space indentation.
+    
+    Uses orjson when available (typically 5-10x faster on large result
+    sets), falling back to the standard library json module. The output
+    is the same for both backends except for non-finite floats: orjson
+    writes NaN and Infinity as null, while the stdlib writes NaN/Infinity.
+    
+    Args:
+        data: JSON-serializable data
+        path: Output file path
+        default: Optional fallback serializer for unsupported types
+    
+    Raises:
+        TypeError: If data contains values that cannot be serialized
+        OSError: If the file cannot be written
+    """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONEncodeError is a TypeError subclass
+        payload = orjson.dumps(data, default=default, option=ORJSON_DUMP_OPTIONS)
+        with open(path, "wb") as f:
+            f.write(payload)
+        return
+    
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=default)
+
+
+# =============================================================================
+# Reading
+# =============================================================================
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Uses orjson when available. Documents orjson rejects (such as NaN or
+    Infinity literals written by older stdlib dumps) are re-parsed with
+    the standard library json module, so results and errors match
+    json.load.
+    
+    Args:
+        path: Input file path
+    
+    Returns:
+        Parsed JSON data
+    
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        OSError: If the file cannot be read
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return json.loads(raw.decode("utf-8"))
+    
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# =============================================================================
+# Serializing
+# =============================================================================
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data to compact UTF-8 JSON bytes.
+    
+    Output matches Starlette's JSONResponse rendering (no whitespace,
+    non-ASCII kept as-is). Uses orjson when available. Non-finite floats
+    differ between the backends: orjson writes NaN and Infinity as null,
+    while the stdlib fallback rejects them with ValueError like Starlette.
+    
+    Args:
+        data: JSON-serializable data
+    
+    Returns:
+        Encoded JSON document
+    
+    Raises:
+        TypeError: If data contains values that cannot be serialized
+        ValueError: If data contains NaN/Infinity (stdlib fallback only)
+    """
+    if ORJSON_AVAILABLE:
+        # orjson.JSONEncodeError is a TypeError subclass
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    
+    return json.dumps(
+        data, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+    ).encode("utf-8")
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "dump_json_file",
+    "dumps_json",
+    "load_json_file",
+    "ORJSON_AVAILABLE",
+]
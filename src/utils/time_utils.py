@@ -0,0 +1,91 @@
+"""
+============================================================================
+Ash-Thrash: Discord Crisis Detection Testing Suite
+The Alphabet Cartel - https://discord.gg/alphabetcartel | alphabetcartel.org
+============================================================================
+
+MISSION - NEVER TO BE VIOLATED:
+    Validate  → Verify crisis detection accuracy through live Ash-NLP integration testing
+    Challenge → Stress test the system with edge cases and adversarial scenarios
+    Guard     → Prevent regressions that could compromise detection reliability
+    Protect   → Safeguard our LGBTQIA+ community through rigorous quality assurance
+
+============================================================================
+Time Utilities for Ash-Thrash Service
+----------------------------------------------------------------------------
+FILE VERSION: v5.0-6-6.5-1
+LAST MODIFIED: 2026-10-18
+PHASE: Phase 6 - A/B Testing Infrastructure (Performance)
+CLEAN ARCHITECTURE: Compliant
+Repository: https://github.com/the-alphabet-cartel/ash-thrash
+============================================================================
+
+RESPONSIBILITIES:
+- Format second-resolution local timestamps with time.strftime
+- Reuse the formatted string for every call within the same second
+
+USAGE:
+    from src.utils.time_utils import CachedTimeFormatter
+
+    iso_time = CachedTimeFormatter("%Y-%m-%dT%H:%M:%S")
+    timestamp = iso_time.format(time.time())
+"""
+
+import time
+from typing import Tuple
+
+# Module version
+__version__ = "v5.0-6-6.5-1"
+
+
+# =============================================================================
+# Timestamp Formatting
+# =============================================================================
+
+class CachedTimeFormatter:
+    """
+    Second-resolution strftime formatter with a one-entry cache.
+
+    Callers that format many timestamps per second (log records, status
+    responses) get the cached string instead of running localtime() and
+    strftime() every time.
+    """
+
+    def __init__(self, fmt: str):
+        """
+        Initialize the formatter.
+
+        Args:
+            fmt: time.strftime format string (second resolution or coarser)
+        """
+        self._fmt = fmt
+
+        # Last (epoch second, formatted string) pair
+        self._cache: Tuple[int, str] = (-1, "")
+
+    def format(self, timestamp: float) -> str:
+        """
+        Format an epoch timestamp as local time.
+
+        Args:
+            timestamp: Seconds since the epoch (fractions are truncated)
+
+        Returns:
+            Formatted local time string
+        """
+        seconds = int(timestamp)
+        cached_second, formatted = self._cache
+        if seconds != cached_second:
+            formatted = time.strftime(self._fmt, time.localtime(seconds))
+            # Single tuple assignment, so concurrent readers never see a torn pair
+            self._cache = (seconds, formatted)
+        return formatted
+
+
+# =============================================================================
+# Export public interface
+# =============================================================================
+
+__all__ = [
+    "CachedTimeFormatter",
+]